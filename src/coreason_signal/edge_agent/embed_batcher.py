@@ -0,0 +1,119 @@
+# Copyright (c) 2025 CoReason, Inc.
+#
+# This software is proprietary and dual-licensed.
+# Licensed under the Prosperity Public License 3.0 (the "License").
+# A copy of the license is available at https://prosperitylicense.com/versions/3.0.0
+# For details, see the LICENSE file.
+# Commercial use beyond a 30-day trial requires a separate license.
+#
+# Source Code: https://github.com/CoReason-AI/coreason_signal
+
+import concurrent.futures
+import queue
+import threading
+import time
+from typing import Any, List, Tuple
+
+from coreason_signal.utils.logger import logger
+
+# Sentinel used to wake the worker thread on shutdown.
+_SENTINEL: Any = object()
+
+
+class EmbedBatcher:
+    """Coalesces concurrent single-text embed requests into micro-batches.
+
+    FastEmbed pays tokenizer and ONNX Runtime session overhead per `embed()`
+    call; its throughput is maximized with larger batches. Callers submit one
+    text at a time via `embed()` and block on the result, while a background
+    worker drains pending requests into batches of up to `batch_size` before
+    invoking the model once per batch.
+
+    Attributes:
+        batch_size (int): Max number of texts embedded in a single model call.
+        linger_s (float): Max time to wait for additional requests to coalesce.
+    """
+
+    def __init__(self, embedding_model: Any, batch_size: int = 64, linger_s: float = 0.005) -> None:
+        """Initialize the batcher and start its worker thread.
+
+        Args:
+            embedding_model (Any): Model exposing `embed(List[str])` returning an iterable of vectors.
+            batch_size (int): Max texts per model call (default: 64).
+            linger_s (float): Seconds to wait for more requests before embedding a partial batch.
+        """
+        self._embedding_model = embedding_model
+        self.batch_size = batch_size
+        self.linger_s = linger_s
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def embed(self, text: str) -> List[float]:
+        """Embed a single text, transparently batched with concurrent requests.
+
+        Blocks until the embedding is available.
+
+        Args:
+            text (str): The text to embed.
+
+        Returns:
+            List[float]: The embedding vector.
+        """
+        future: "concurrent.futures.Future[List[float]]" = concurrent.futures.Future()
+        self._queue.put((text, future))
+        return future.result()
+
+    def close(self) -> None:
+        """Stop the worker thread, flushing any in-flight batch first."""
+        self._queue.put(_SENTINEL)
+        self._worker.join()
+
+    def _collect_batch(self, first: Tuple[str, "concurrent.futures.Future[List[float]]"]) -> List[Any]:
+        """Drain pending requests into a batch, waiting up to `linger_s` for stragglers.
+
+        Args:
+            first (Tuple): The first (text, future) item already pulled from the queue.
+
+        Returns:
+            List[Any]: The batch of (text, future) items.
+        """
+        batch = [first]
+        deadline = time.monotonic() + self.linger_s
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is _SENTINEL:
+                # Re-queue so the outer loop sees it and exits after this batch.
+                self._queue.put(item)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self) -> None:
+        """Worker loop: pull requests, embed them in batches, resolve futures."""
+        while True:
+            item = self._queue.get()
+            if item is _SENTINEL:
+                break
+
+            batch = self._collect_batch(item)
+            texts = [text for text, _ in batch]
+            try:
+                vectors = list(self._embedding_model.embed(texts))
+                # strict: a model returning the wrong vector count must fail
+                # every future loudly, not leave the tail waiting forever.
+                paired = list(zip(batch, vectors, strict=True))
+            except Exception as e:
+                logger.error(f"Batch embed failed for {len(texts)} texts: {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), vector in paired:
+                future.set_result(vector)
@@ -8,23 +8,75 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_signal
 
-from typing import List
+import functools
+import json
+import re
+import threading
+from binascii import a2b_base64 as _b64decode
+from binascii import b2a_base64 as _b64encode
+from typing import Dict, List, Optional, Set, Tuple
 
+import anyio
 import lancedb
+import numpy as np
+import pyarrow as pa
 from fastembed import TextEmbedding
 
-from coreason_signal.schemas import SOPDocument
+from coreason_signal.edge_agent.embed_batcher import EmbedBatcher
+from coreason_signal.schemas import AgentReflex, SOPDocument
 from coreason_signal.utils.logger import logger
 
+# Variable tokens in templated log lines ("timeout after 30s", "code 0x4f"):
+# collapsing them multiplies the embedding-cache hit rate without changing
+# which SOP a message retrieves.
+_HEX_PATTERN = re.compile(r"0x[0-9a-f]+")
+_NUM_PATTERN = re.compile(r"\d+")
+_TOKEN_PATTERN = re.compile(r"[a-z0-9_]+")
+
+# A keyword prefilter hit requires strictly more matching keywords than this,
+# and exactly one candidate SOP — enough specificity to skip the embedding
+# forward pass without risking a wrong short-circuit on generic words.
+_PREFILTER_MIN_MATCHES = 2
+
+# Process-wide embedding model cache. The ORT session and tokenizer cost
+# hundreds of MB of RAM and seconds to load; every store instance sharing
+# one model makes that a one-time cost per model name.
+_MODEL_CACHE: Dict[str, TextEmbedding] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def _get_model(model_name: str) -> TextEmbedding:
+    """Return a shared TextEmbedding instance for the given model name.
+
+    Args:
+        model_name (str): Name of the embedding model to load with FastEmbed.
+
+    Returns:
+        TextEmbedding: The cached (or newly constructed) model instance.
+    """
+    with _MODEL_CACHE_LOCK:
+        model = _MODEL_CACHE.get(model_name)
+        if model is None:
+            model = TextEmbedding(model_name=model_name, lazy_load=True)
+            _MODEL_CACHE[model_name] = model
+        return model
+
 
 class LocalVectorStore:
-    """In-process vector store using LanceDB for Edge Agent RAG.
+    """In-process vector store for Edge Agent RAG.
 
-    Manages the storage and retrieval of Standard Operating Procedures (SOPs)
-    using semantic embeddings.
+    Holds the SOP corpus in memory as a stacked int8 matrix and answers queries
+    with a brute-force NumPy distance scan: for the few hundred to few thousand
+    SOPs an edge gateway carries, one vectorized scan beats the per-query
+    connect/metadata/schema overhead of a database round-trip. LanceDB is kept
+    as the persistence layer, written at ingest and loaded once at startup.
+
+    Invariant: every vector is L2-normalized before quantization, both at ingest
+    and at query time, so cosine similarity reduces to a plain dot product in
+    the scan — no per-comparison norm recomputation.
 
     Attributes:
-        db_path (str): URI of the LanceDB database.
+        db_path (str): URI of the LanceDB database used for persistence.
         embedding_model_name (str): Name of the embedding model used.
     """
 
@@ -39,7 +91,187 @@ class LocalVectorStore:
         self.embedding_model_name = embedding_model_name
         self._db = lancedb.connect(db_path)
         self._table_name = "sops"
-        self._embedding_model = TextEmbedding(model_name=self.embedding_model_name)
+        # Resolve the table handle once at startup; open_table is a
+        # metadata/schema round-trip we don't want to retry per ingest.
+        try:
+            self._table: Optional[lancedb.table.Table] = self._db.open_table(self._table_name)
+        except ValueError:
+            self._table = None
+        self._embedding_model = _get_model(self.embedding_model_name)
+        # Micro-batches concurrent single-text embeds to amortize ORT session overhead.
+        self._batcher = EmbedBatcher(self._embedding_model, batch_size=64)
+        # Per-instance memoization of query embeddings. Edge log streams repeat the
+        # same error messages constantly, and the encoder forward pass dominates
+        # query latency, so caching by normalized message text skips it entirely.
+        self._embed_query = functools.lru_cache(maxsize=1024)(self._embed_query_uncached)
+
+        # In-memory corpus scanned by query(): int8 vectors, their dequantization
+        # scales, and the SOP documents in matching row order.
+        self._sops: List[SOPDocument] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None
+        # Inverted keyword index (token -> SOP row indices) built from titles
+        # and metadata keywords; lets query() short-circuit the embedding
+        # forward pass when a message names one SOP unambiguously.
+        self._keyword_index: Dict[str, Set[int]] = {}
+        self._load_persisted()
+
+    def _embed_query_uncached(self, text: str) -> np.ndarray:
+        """Embed a single query string.
+
+        Wrapped with `functools.lru_cache` in `__init__` (see `_embed_query`).
+        Returns a contiguous fp32 array — a cached tuple of boxed Python
+        floats would cost ~7x the memory and a re-pack on every hit.
+
+        Args:
+            text (str): Normalized query text.
+
+        Returns:
+            np.ndarray: The fp32 embedding vector.
+        """
+        return np.asarray(self._batcher.embed(text), dtype=np.float32)
+
+    @staticmethod
+    def _templatize(text: str) -> str:
+        """Replace variable tokens (hex codes, numbers) with placeholders.
+
+        Args:
+            text (str): Normalized (lowercased) query text.
+
+        Returns:
+            str: The templated text used as the embedding cache key.
+        """
+        return _NUM_PATTERN.sub("<N>", _HEX_PATTERN.sub("<X>", text))
+
+    @staticmethod
+    def _quantize(vector: np.ndarray) -> Tuple[np.ndarray, float]:
+        """Symmetrically quantize a float vector to int8 with a per-vector scale.
+
+        Cuts per-vector storage 4x versus fp32; the original vector is recovered
+        (approximately) as `quantized * scale`.
+
+        Args:
+            vector (np.ndarray): The float vector to quantize.
+
+        Returns:
+            Tuple[np.ndarray, float]: The int8 vector and its dequantization scale.
+        """
+        scale = float(np.max(np.abs(vector))) / 127.0
+        if scale == 0.0:
+            scale = 1.0  # All-zero vector; any scale round-trips to zeros
+        return np.round(vector / scale).astype(np.int8), scale
+
+    @staticmethod
+    def _cosine_scores(matrix: np.ndarray, scales: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """Score every stored vector against a dequantized query vector.
+
+        The per-vector dequantization scale factors out of the dot product
+        (`(s_i * M_i) . q == s_i * (M_i . q)`), so the scan is a single
+        BLAS GEMV over the widened int8 matrix followed by an elementwise
+        scale — no (N, dim) dequantized temporary per query.
+
+        Args:
+            matrix (np.ndarray): int8 corpus matrix of shape (N, dim).
+            scales (np.ndarray): fp32 dequantization scales of shape (N,).
+            query (np.ndarray): Dequantized fp32 query vector of shape (dim,).
+
+        Returns:
+            np.ndarray: Cosine scores of shape (N,).
+        """
+        scores: np.ndarray = (matrix.astype(np.float32) @ query) * scales
+        return scores
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray:
+        """L2-normalize a vector, guarding against zero norm.
+
+        Args:
+            vector (np.ndarray): The float vector to normalize.
+
+        Returns:
+            np.ndarray: The unit-length vector.
+        """
+        unit: np.ndarray = vector / (np.linalg.norm(vector) + 1e-12)
+        return unit
+
+    def _append_to_corpus(self, sops: List[SOPDocument], matrix: np.ndarray, scales: np.ndarray) -> None:
+        """Extend the in-memory corpus with new rows.
+
+        Args:
+            sops (List[SOPDocument]): The SOP documents, in row order.
+            matrix (np.ndarray): int8 vectors of shape (len(sops), dim).
+            scales (np.ndarray): fp32 dequantization scales of shape (len(sops),).
+        """
+        if self._matrix is None:
+            self._matrix = matrix
+            self._scales = scales
+        else:
+            self._matrix = np.vstack([self._matrix, matrix])
+            self._scales = np.concatenate([self._scales, scales])
+
+        base = len(self._sops)
+        self._sops.extend(sops)
+        for offset, sop in enumerate(sops):
+            keywords = set(_TOKEN_PATTERN.findall(sop.title.lower()))
+            keywords.update(str(kw).lower() for kw in sop.metadata.get("keywords", []))
+            for keyword in keywords:
+                self._keyword_index.setdefault(keyword, set()).add(base + offset)
+
+    def _keyword_prefilter(self, query_text: str) -> Optional[SOPDocument]:
+        """Resolve a query by keyword match alone, if it is unambiguous.
+
+        Args:
+            query_text (str): The raw query string.
+
+        Returns:
+            Optional[SOPDocument]: The single SOP whose keywords the message
+            matches more than `_PREFILTER_MIN_MATCHES` times, or None if no
+            candidate (or more than one) qualifies.
+        """
+        matches: Dict[int, int] = {}
+        for token in set(_TOKEN_PATTERN.findall(query_text.lower())):
+            for idx in self._keyword_index.get(token, ()):
+                matches[idx] = matches.get(idx, 0) + 1
+
+        candidates = [idx for idx, count in matches.items() if count > _PREFILTER_MIN_MATCHES]
+        if len(candidates) == 1:
+            return self._sops[candidates[0]]
+        return None
+
+    def _load_persisted(self) -> None:
+        """Hydrate the in-memory corpus from the LanceDB table, if one exists."""
+        if self._table is None:
+            return
+
+        arrow = self._table.to_arrow()
+        payloads = [_b64decode(encoded) for encoded in arrow["vector_q8"].to_pylist()]
+        scales = np.frombuffer(b"".join(p[:4] for p in payloads), dtype=np.float32)
+        matrix = np.frombuffer(b"".join(p[4:] for p in payloads), dtype=np.int8).reshape(len(payloads), -1)
+
+        # Column-wise extraction: one contiguous decode per column instead of
+        # materializing a Python dict per row via to_pylist(). model_construct
+        # skips revalidation: every persisted row came from a SOPDocument that
+        # was already validated at ingest. query() returns these references by
+        # index, so no model is ever constructed on the query path.
+        sops = [
+            SOPDocument.model_construct(
+                id=sop_id,
+                title=title,
+                content=content,
+                metadata=json.loads(metadata),
+                associated_reflex=(None if reflex == "null" else AgentReflex.model_construct(**json.loads(reflex))),
+            )
+            for sop_id, title, content, metadata, reflex in zip(
+                arrow["id"].to_pylist(),
+                arrow["title"].to_pylist(),
+                arrow["content"].to_pylist(),
+                arrow["metadata"].to_pylist(),
+                arrow["associated_reflex"].to_pylist(),
+                strict=True,
+            )
+        ]
+        self._append_to_corpus(sops, matrix, scales)
+        logger.info(f"Loaded {len(sops)} persisted SOPs into memory")
 
     def add_sops(self, sops: List[SOPDocument]) -> None:
         """Embed and store SOP documents in the vector store.
@@ -53,41 +285,61 @@ class LocalVectorStore:
         logger.info(f"Adding {len(sops)} SOPs to vector store")
 
         documents = [sop.content for sop in sops]
-        # Generate embeddings
-        embeddings = list(self._embedding_model.embed(documents))
-
-        data = []
-        for i, sop in enumerate(sops):
-            item = sop.model_dump()
-            item["vector"] = embeddings[i]
-            data.append(item)
-
-        # For lancedb >= 0.26.0, list_tables() returns an iterator of table names
-        # or a Pydantic model (ListTablesResponse) depending on the connection type.
-        # We handle this by checking if it has a .tables attribute or iterating.
-        # Note: table_names() is deprecated but returns a list of strings directly.
-        # To be safe and forward compatible:
-        existing_tables = []
-        try:
-            # Try new API first
-            tables_response = self._db.list_tables()
-            if hasattr(tables_response, "tables"):
-                existing_tables = tables_response.tables
-            else:
-                existing_tables = list(tables_response)  # pragma: no cover
-        except Exception:  # pragma: no cover
-            # Fallback to deprecated if needed or just empty
-            existing_tables = []  # pragma: no cover
-
-        if self._table_name in existing_tables:
-            table = self._db.open_table(self._table_name)
-            table.add(data)
+        # Generate embeddings. parallel=0 fans the corpus out across all cores
+        # (independent model copies), which gives near-linear speedup for the
+        # initial bulk upload; single-query embeds stay on the default path.
+        embeddings = list(self._embedding_model.embed(documents, batch_size=256, parallel=0))
+
+        # Store int8-quantized vectors plus their scales: 4x less per vector
+        # than fp32, and the scan is memory-bandwidth bound. The scale is a
+        # 4-byte fp32 prefix on the int8 payload, base64-encoded for string-
+        # column reliability. Normalize before quantizing so queries reduce
+        # to dot products.
+        # Batch quantization: one vectorized pass over the whole embedding
+        # block instead of per-row _normalize/_quantize calls.
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        normalized = vectors / (np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-12)
+        scales = np.max(np.abs(normalized), axis=1) / np.float32(127.0)
+        scales[scales == 0.0] = 1.0  # All-zero vectors; any scale round-trips to zeros
+        quantized = np.round(normalized / scales[:, None]).astype(np.int8)
+        payloads = [
+            _b64encode(np.float32(scale).tobytes() + row.tobytes(), newline=False).decode("ascii")
+            for scale, row in zip(scales, quantized, strict=True)
+        ]
+
+        # Columnar (SoA) layout handed to lance as one Arrow table: no per-row
+        # dict allocation, and Arrow packs each column contiguously. Nested
+        # fields are flattened to JSON strings: lance misreads struct/null
+        # columns inferred from rows, and string columns round-trip reliably
+        # regardless of which SOPs carry a reflex or metadata.
+        data = pa.table(
+            {
+                "id": [sop.id for sop in sops],
+                "title": [sop.title for sop in sops],
+                "content": [sop.content for sop in sops],
+                "metadata": [json.dumps(sop.metadata) for sop in sops],
+                "associated_reflex": [
+                    sop.associated_reflex.model_dump_json() if sop.associated_reflex else "null" for sop in sops
+                ],
+                "vector_q8": payloads,
+            }
+        )
+
+        if self._table is not None:
+            self._table.add(data)
         else:
-            self._db.create_table(self._table_name, data=data)
+            self._table = self._db.create_table(self._table_name, data=data)
+
+        self._append_to_corpus(list(sops), quantized, scales)
 
     def query(self, query_text: str, k: int = 3) -> List[SOPDocument]:
         """Perform a semantic search for SOPs.
 
+        A keyword prefilter resolves unambiguous messages without embedding;
+        otherwise this is a brute-force cosine scan over the in-memory int8
+        matrix — since stored vectors are pre-normalized (see class docstring),
+        a single dot product per row. Never touches LanceDB on the hot path.
+
         Args:
             query_text (str): The query string (e.g., error message context).
             k (int): Number of nearest neighbors to return.
@@ -95,36 +347,43 @@ class LocalVectorStore:
         Returns:
             List[SOPDocument]: List of SOPDocument objects matching the query.
         """
-        existing_tables = []
-        try:
-            tables_response = self._db.list_tables()
-            if hasattr(tables_response, "tables"):
-                existing_tables = tables_response.tables
-            else:
-                existing_tables = list(tables_response)  # pragma: no cover
-        except Exception:  # pragma: no cover
-            existing_tables = []  # pragma: no cover
-
-        if self._table_name not in existing_tables:
+        if self._matrix is None or self._scales is None:
             logger.warning("Query attempted on empty vector store")
             return []
 
-        table = self._db.open_table(self._table_name)
+        # Cheap keyword prefilter: messages that name an SOP unambiguously
+        # (error code, protocol name) skip the embedding forward pass entirely.
+        prefilter_hit = self._keyword_prefilter(query_text)
+        if prefilter_hit is not None:
+            logger.debug(f"Keyword prefilter hit: {prefilter_hit.id}")
+            return [prefilter_hit]
 
-        # Embed the query
-        query_embedding = list(self._embedding_model.embed([query_text]))[0]
+        # Embed the query (memoized; normalize and templatize to collapse
+        # near-duplicate log lines onto one cache entry)
+        template = self._templatize(query_text.strip().lower())
+        query_embedding = self._embed_query(template)
 
-        results = table.search(query_embedding).limit(k).to_list()
+        quantized_query, query_scale = self._quantize(self._normalize(query_embedding))
+        dequantized_query = quantized_query.astype(np.float32) * query_scale
 
-        sops = []
-        for res in results:
-            sop_data = {
-                "id": res["id"],
-                "title": res["title"],
-                "content": res["content"],
-                "metadata": res["metadata"],
-                "associated_reflex": res.get("associated_reflex"),
-            }
-            sops.append(SOPDocument(**sop_data))
+        scores = self._cosine_scores(self._matrix, self._scales, dequantized_query)
+        k_eff = min(k, len(scores))
+        top_k = np.argpartition(-scores, k_eff - 1)[:k_eff]
+        top_k = top_k[np.argsort(-scores[top_k])]
 
-        return sops
+        return [self._sops[idx] for idx in top_k]
+
+    async def query_async(self, query_text: str, k: int = 3) -> List[SOPDocument]:
+        """Async facade for `query`.
+
+        Runs the blocking embed + scan in a worker thread so callers on the
+        event loop (e.g., FastAPI handlers) are not head-of-line blocked.
+
+        Args:
+            query_text (str): The query string (e.g., error message context).
+            k (int): Number of nearest neighbors to return.
+
+        Returns:
+            List[SOPDocument]: List of SOPDocument objects matching the query.
+        """
+        return await anyio.to_thread.run_sync(functools.partial(self.query, query_text, k))
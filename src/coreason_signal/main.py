@@ -11,15 +11,17 @@
 """Main application entry point for Coreason Signal."""
 
 import argparse
-import json
 import signal
 import sys
 from types import FrameType
 from typing import Optional
 
+import orjson
 from coreason_identity.models import UserContext
 from coreason_identity.types import SecretStr
+from pydantic import ValidationError
 
+from coreason_signal.schemas import LOG_EVENT_ADAPTER
 from coreason_signal.service import Service
 from coreason_signal.utils.logger import logger
 
@@ -68,12 +70,19 @@ def main() -> None:
         with svc:
             if args.command == "ingest":
                 try:
-                    data = json.loads(args.data)
+                    # orjson parses in C; same error contract as json.loads
+                    data = orjson.loads(args.data)
+                    # Validate up front: ingest_signal only warns on a bad
+                    # event, which would report success for a dropped signal.
+                    LOG_EVENT_ADAPTER.validate_python(data)
                     svc.ingest_signal(data, system_context)
                     print("Signal ingested successfully.")
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.error("Invalid JSON data provided.")
                     sys.exit(1)
+                except ValidationError as e:
+                    logger.error(f"Signal data is not a valid LogEvent: {e}")
+                    sys.exit(1)
 
             elif args.command == "query":
                 results = svc.query_signals(args.query, args.top_k, system_context)
@@ -84,7 +93,7 @@ def main() -> None:
                         output.append(res.model_dump())
                     else:
                         output.append(res)
-                print(json.dumps(output, indent=2, default=str))
+                print(orjson.dumps(output, option=orjson.OPT_INDENT_2, default=str).decode())
 
             elif args.command == "serve":
                 logger.info(
@@ -10,34 +10,93 @@
 
 """Data schemas for Coreason Signal."""
 
-from typing import Any, Dict, List, Optional
+import re
+import sys
+import time
+from typing import Annotated, Any, Dict, FrozenSet, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
+# Low-cardinality string fields (log levels, driver types, reflex actions)
+# recur across millions of events. Interning the validated value collapses
+# every occurrence onto one PyUnicode object, so equality checks and dict
+# lookups keyed on them resolve by pointer identity.
+_intern = sys.intern
 
-class DeviceDefinition(BaseModel):
+# Device endpoints are always http(s)://host[:port][/path] (IPv6 hosts in
+# brackets). A precompiled regex match is an order of magnitude cheaper per
+# validation than the full RFC 3986 parser behind HttpUrl, and keeps the
+# stored value a plain str instead of a Url object.
+_ENDPOINT_RE = re.compile(r"^https?://(?:\[[0-9A-Fa-f:.]+\]|[^/:\s]+)(?::\d{1,5})?(?:/.*)?$")
+
+
+def _validate_endpoint(v: str) -> str:
+    """Validate the constrained endpoint format with one regex match.
+
+    Args:
+        v (str): The candidate endpoint string.
+
+    Returns:
+        str: The endpoint unchanged.
+
+    Raises:
+        ValueError: If the value is not an http(s)://host[:port] URL.
+    """
+    if not _ENDPOINT_RE.match(v):
+        raise ValueError(f"Invalid endpoint URL: {v!r}")
+    return v
+
+
+class _StrictBase(BaseModel):
+    """Shared base for schemas that reject unknown fields.
+
+    Centralizes the config so each schema inherits it instead of
+    re-instantiating its own ConfigDict. Instances are frozen: nothing in
+    the codebase mutates a validated schema in place, freezing skips the
+    assignment-dispatch machinery, and hot-loop events can be hashed or
+    shared across threads without defensive copies.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+
+class DeviceDefinition(_StrictBase):
     """Hardware abstraction layer mapping for SiLA 2 and legacy instruments.
 
     Attributes:
         id (str): Unique identifier for the device (e.g., "LiquidHandler-01").
         driver_type (str): Type of driver to use (e.g., "SiLA2", "SerialWrapper").
-        endpoint (HttpUrl): Network endpoint of the device (e.g., "https://192.168.1.50:50052").
+        endpoint (str): Network endpoint of the device (e.g., "https://192.168.1.50:50052").
         capabilities (List[str]): List of capabilities supported by the device.
         edge_agent_model (str): Identifier for the edge agent model to use.
-        allowed_reflexes (List[str]): List of allowed reflex actions (e.g., ["RETRY", "PAUSE"]).
+        allowed_reflexes (FrozenSet[str]): Allowed reflex actions (e.g., {"RETRY", "PAUSE"}).
     """
 
     id: str
     driver_type: str
-    endpoint: HttpUrl
+    endpoint: Annotated[str, AfterValidator(_validate_endpoint)]
     capabilities: List[str]
 
     # Edge AI Config
     edge_agent_model: str
-    allowed_reflexes: List[str]
+    # Frozenset so "is this reflex permitted?" is an O(1) hash probe on an
+    # interned key rather than a list scan.
+    allowed_reflexes: FrozenSet[str]
+
+    @field_validator("driver_type", mode="after")
+    @classmethod
+    def _intern_driver_type(cls, v: str) -> str:
+        """Intern the driver type so all definitions share one str object."""
+        return _intern(v)
+
+    @field_validator("allowed_reflexes", mode="after")
+    @classmethod
+    def _intern_reflexes(cls, v: FrozenSet[str]) -> FrozenSet[str]:
+        """Intern reflex names so membership checks hash shared objects."""
+        return frozenset(_intern(x) for x in v)
 
 
-class SoftSensorModel(BaseModel):
+class SoftSensorModel(_StrictBase):
     """Configuration for physics-informed neural networks (PINNs) acting as virtual sensors.
 
     Attributes:
@@ -48,6 +107,8 @@ class SoftSensorModel(BaseModel):
         model_artifact (bytes): The binary content of the ONNX model file.
     """
 
+    # Runtime constraint updates go through SoftSensorEngine
+    # .update_constraints, which swaps in a model_copy.
     id: str
     input_sensors: List[str]
     target_variable: str
@@ -55,7 +116,7 @@ class SoftSensorModel(BaseModel):
     model_artifact: bytes
 
 
-class AgentReflex(BaseModel):
+class AgentReflex(_StrictBase):
     """Schema for an autonomous action taken by the Edge Agent.
 
     Attributes:
@@ -64,14 +125,18 @@ class AgentReflex(BaseModel):
         reasoning (str): Textual explanation for why this action was chosen.
     """
 
-    model_config = ConfigDict(extra="forbid")
-
     action: str = Field(..., min_length=1, description="Name of the action, e.g., 'Aspirate'")
     parameters: Dict[str, Any] = Field(
         default_factory=dict, description="Parameters for the action, e.g., {'speed': 0.5}"
     )
     reasoning: str = Field(..., description="Explanation for why this reflex was triggered.")
 
+    @field_validator("action", mode="after")
+    @classmethod
+    def _intern_action(cls, v: str) -> str:
+        """Intern the action name; the reflex vocabulary is a handful of verbs."""
+        return _intern(v)
+
 
 class SOPDocument(BaseModel):
     """Schema for a Standard Operating Procedure (SOP) document used for RAG.
@@ -84,7 +149,7 @@ class SOPDocument(BaseModel):
         associated_reflex (Optional[AgentReflex]): A pre-defined reflex action for this SOP.
     """
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     id: str = Field(..., min_length=1, description="Unique identifier for the SOP, e.g., 'SOP-104'")
     title: str = Field(..., min_length=1, description="Title of the SOP")
@@ -95,12 +160,13 @@ class SOPDocument(BaseModel):
     )
 
 
-class LogEvent(BaseModel):
+class LogEvent(_StrictBase):
     """Schema for a log event that triggers the Edge Agent.
 
     Attributes:
         id (str): Unique Event ID.
-        timestamp (str): ISO 8601 Timestamp of the event.
+        timestamp_ns (int): Event time as epoch nanoseconds (UTC). A packed
+            int64 column in Arrow instead of one datetime object per event.
         level (str): Log severity level (e.g., "INFO", "ERROR").
         source (str): Identifier of the source component/instrument.
         message (str): The main log message.
@@ -108,18 +174,22 @@ class LogEvent(BaseModel):
         metadata (Dict[str, Any]): Additional context for the event.
     """
 
-    model_config = ConfigDict(extra="forbid")
-
     id: str = Field(..., min_length=1, description="Unique Event ID")
-    timestamp: str = Field(..., description="ISO 8601 Timestamp")
+    timestamp_ns: int = Field(default_factory=time.time_ns, description="Event time as epoch nanoseconds (UTC)")
     level: str = Field(..., description="Log level, e.g., 'INFO', 'ERROR'")
     source: str = Field(..., description="Source component/instrument ID")
     message: str = Field(..., description="The semantic log message, e.g., 'Vacuum Pressure Low'")
     raw_code: Optional[str] = Field(None, description="Original error code, e.g., 'ERR_0x4F'")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
+    @field_validator("level", "source", mode="after")
+    @classmethod
+    def _intern_enum_like(cls, v: str) -> str:
+        """Intern level and source; both repeat across the event stream."""
+        return _intern(v)
 
-class SemanticFact(BaseModel):
+
+class SemanticFact(_StrictBase):
     """Represents a derived semantic fact (Subject-Predicate-Object).
 
     Used for constructing the Knowledge Graph.
@@ -130,14 +200,12 @@ class SemanticFact(BaseModel):
         object (str): The object node or value (e.g., 'Acidic_Stress').
     """
 
-    model_config = ConfigDict(extra="forbid")
-
     subject: str = Field(..., description="The subject node ID, e.g., 'Bioreactor-01'")
     predicate: str = Field(..., description="The relationship type, e.g., 'STATE_CHANGE'")
     object: str = Field(..., description="The object node or value, e.g., 'Acidic_Stress'")
 
 
-class TwinUpdate(BaseModel):
+class TwinUpdate(_StrictBase):
     """Payload for updating the Digital Twin (Graph Nexus).
 
     Attributes:
@@ -147,11 +215,20 @@ class TwinUpdate(BaseModel):
         derived_facts (List[SemanticFact]): List of facts derived from the update.
     """
 
-    model_config = ConfigDict(extra="forbid")
-
     entity_id: str = Field(..., description="ID of the entity being updated")
     timestamp: str = Field(..., description="ISO 8601 Timestamp of the update")
     properties: Dict[str, Any] = Field(default_factory=dict, description="Raw property updates, e.g., {'ph': 6.2}")
     derived_facts: List[SemanticFact] = Field(
         default_factory=list, description="List of semantic facts derived from the update"
     )
+
+
+# Module-level adapter for the telemetry ingestion hot path. Constructing a
+# TypeAdapter compiles the validator graph once at import; validate_python
+# then reuses it on every event instead of going through the class __init__
+# dispatch per call.
+LOG_EVENT_ADAPTER: TypeAdapter[LogEvent] = TypeAdapter(LogEvent)
+
+# Batch variant for telemetry streams: validating a whole list walks the batch
+# inside pydantic-core with one Python->Rust crossing, instead of one per event.
+LOG_EVENT_LIST_ADAPTER: TypeAdapter[List[LogEvent]] = TypeAdapter(List[LogEvent])
@@ -12,24 +12,55 @@
 Core service logic for Coreason Signal, implementing the Async-Native with Sync Facade pattern.
 """
 
+import asyncio
 import contextlib
+import functools
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from types import TracebackType
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Coroutine, Dict, List, Optional, Tuple, TypeVar
 
 import anyio
 import httpx
 from coreason_identity.models import UserContext
 
 from coreason_signal.config import settings
-from coreason_signal.edge_agent.reflex_engine import ReflexEngine
-from coreason_signal.edge_agent.vector_store import LocalVectorStore
-from coreason_signal.schemas import DeviceDefinition, LogEvent
-from coreason_signal.sila.server import SiLAGateway
-from coreason_signal.soft_sensor.engine import SoftSensorEngine
-from coreason_signal.streaming.flight_server import SignalFlightServer
+from coreason_signal.schemas import LOG_EVENT_ADAPTER, LOG_EVENT_LIST_ADAPTER, DeviceDefinition
 from coreason_signal.utils.logger import logger
 
+if TYPE_CHECKING:
+    from coreason_signal.edge_agent.reflex_engine import ReflexEngine
+    from coreason_signal.edge_agent.vector_store import LocalVectorStore
+    from coreason_signal.sila.server import SiLAGateway
+    from coreason_signal.soft_sensor.engine import SoftSensorEngine
+    from coreason_signal.streaming.flight_server import SignalFlightServer
+
+# Default gateway definition, validated once at import instead of on every
+# setup() call (and every test that builds a service). DeviceDefinition is
+# frozen, so sharing a single instance is safe.
+_DEFAULT_DEVICE_DEF = DeviceDefinition(
+    id="Coreason-Edge-Gateway",
+    driver_type="SiLA2",
+    endpoint=f"http://0.0.0.0:{settings.SILA_PORT}",
+    capabilities=["EdgeAgent"],
+    edge_agent_model="default",
+    allowed_reflexes=["PAUSE", "NOTIFY"],
+)
+
+# Shared pool for the blocking server loops. OS threads (and their ~8 MB
+# virtual stacks) are reused across Service instances instead of paying a
+# pthread_create per restart — relevant for test suites and embedded
+# controllers that cycle the service repeatedly.
+_SERVICE_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="coreason")
+
+_T = TypeVar("_T")
+
+# Process-level cache of loaded vector stores keyed by (db_path, model name).
+# Loading one costs hundreds of ms (embedding model init) and hundreds of MB
+# of tensors; repeated Service lifecycles in one process reuse the instance.
+_VECTOR_STORE_CACHE: Dict[Tuple[str, str], "LocalVectorStore"] = {}
+
 
 class ServiceAsync:
     """Async-native core service for Coreason Signal.
@@ -37,6 +68,9 @@ class ServiceAsync:
     Handles the lifecycle of the Edge Agent, SiLA Gateway, and other engines.
     """
 
+    # Grace period for server threads to unwind after stop() is issued.
+    _THREAD_JOIN_TIMEOUT = 5.0
+
     def __init__(self, client: Optional[httpx.AsyncClient] = None) -> None:
         """Initialize the ServiceAsync instance.
 
@@ -45,16 +79,24 @@ class ServiceAsync:
                                                   If not provided, one will be created.
         """
         self._internal_client = client is None
-        self._client = client or httpx.AsyncClient()
+        # Keepalive tuning: device endpoints are hit repeatedly with small
+        # requests, so holding connections open amortizes the TCP/TLS
+        # handshake that otherwise dominates each call. One transport-level
+        # retry covers idle keepalive connections the peer closed.
+        self._client = client or httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128, keepalive_expiry=60.0),
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            transport=httpx.AsyncHTTPTransport(retries=1),
+        )
 
-        self.gateway: Optional[SiLAGateway] = None
-        self.flight_server: Optional[SignalFlightServer] = None
-        self.reflex_engine: Optional[ReflexEngine] = None
-        self.soft_sensor_engine: Optional[SoftSensorEngine] = None
+        self.gateway: Optional["SiLAGateway"] = None
+        self.flight_server: Optional["SignalFlightServer"] = None
+        self.reflex_engine: Optional["ReflexEngine"] = None
+        self.soft_sensor_engine: Optional["SoftSensorEngine"] = None
 
-        # Threads for legacy blocking servers
-        self._gateway_thread: Optional[threading.Thread] = None
-        self._flight_thread: Optional[threading.Thread] = None
+        # Futures for the legacy blocking servers running on the shared pool
+        self._gateway_future: Optional[Future[None]] = None
+        self._flight_future: Optional[Future[None]] = None
         self._shutdown_event = threading.Event()
 
     async def __aenter__(self) -> "ServiceAsync":
@@ -73,47 +115,59 @@ class ServiceAsync:
         if self._internal_client:
             await self._client.aclose()
 
+    async def _init_reflex_engine(self) -> None:
+        """Load the vector store and build the reflex engine on top of it.
+
+        Runs the blocking store load (embedding model + LanceDB open) in a
+        worker thread.
+        """
+        # Deferred imports: these pull in lancedb and the embedding runtime.
+        from coreason_signal.edge_agent.reflex_engine import ReflexEngine
+        from coreason_signal.edge_agent.vector_store import LocalVectorStore
+
+        key = (settings.VECTOR_STORE_PATH, settings.EMBEDDING_MODEL)
+        vector_store = _VECTOR_STORE_CACHE.get(key)
+        if vector_store is None:
+            vector_store = await anyio.to_thread.run_sync(
+                lambda: LocalVectorStore(db_path=key[0], embedding_model_name=key[1])
+            )
+            _VECTOR_STORE_CACHE[key] = vector_store
+        self.reflex_engine = ReflexEngine(vector_store=vector_store, decision_timeout=settings.REFLEX_TIMEOUT)
+
+    async def _init_gateway(self) -> None:
+        """Build the SiLA gateway (capability loading may be IO bound)."""
+        # Deferred import: pulls in the sila2/grpc stack.
+        from coreason_signal.sila.server import SiLAGateway
+
+        self.gateway = await anyio.to_thread.run_sync(
+            lambda: SiLAGateway(device_def=_DEFAULT_DEVICE_DEF, arrow_flight_port=settings.ARROW_FLIGHT_PORT)
+        )
+
     async def setup(self) -> None:
-        """Initialize all components of the application asynchronously."""
+        """Initialize all components of the application asynchronously.
+
+        The vector-store load and the SiLA gateway build are independent, so
+        they run concurrently in a task group; startup takes the slower of
+        the two instead of their sum.
+        """
         if self.gateway:
             logger.debug("Service already initialized.")
             return
 
         logger.info("Initializing Coreason Signal (Async)...")
 
-        # 1. Initialize RAG / Vector Store
-        # Note: LocalVectorStore currently looks synchronous in its init.
-        # If it has async init methods, they should be called here.
-        # Assuming synchronous init is fine for now as it loads DB.
-        # We wrap it in to_thread if it's blocking IO.
-        vector_store = await anyio.to_thread.run_sync(
-            lambda: LocalVectorStore(db_path=settings.VECTOR_STORE_PATH, embedding_model_name=settings.EMBEDDING_MODEL)
-        )
-
-        # 2. Initialize Reflex Engine
-        # ReflexEngine init is also sync.
-        self.reflex_engine = ReflexEngine(vector_store=vector_store, decision_timeout=settings.REFLEX_TIMEOUT)
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(self._init_reflex_engine)
+            tg.start_soon(self._init_gateway)
 
-        # 3. Load Device Definition
-        device_def = DeviceDefinition(
-            id="Coreason-Edge-Gateway",
-            driver_type="SiLA2",
-            endpoint=f"http://0.0.0.0:{settings.SILA_PORT}",
-            capabilities=["EdgeAgent"],
-            edge_agent_model="default",
-            allowed_reflexes=["PAUSE", "NOTIFY"],
-        )
-
-        # 4. Initialize SiLA Gateway
-        # SiLAGateway init involves loading capabilities, which might be IO bound.
-        self.gateway = await anyio.to_thread.run_sync(
-            lambda: SiLAGateway(device_def=device_def, arrow_flight_port=settings.ARROW_FLIGHT_PORT)
-        )
+        # Arrow Flight Server: cheap synchronous bind, after the group so a
+        # failed init above doesn't leave an orphaned listener.
+        # Deferred import: pulls in pyarrow.flight.
+        from coreason_signal.streaming.flight_server import SignalFlightServer
 
-        # 5. Initialize Arrow Flight Server
         self.flight_server = SignalFlightServer(port=settings.ARROW_FLIGHT_PORT)
 
-        # 6. Initialize Soft Sensor Engine
+        # Soft Sensor Engine
         # TODO: Load from configuration or model registry.
         if not self.soft_sensor_engine:
             logger.info("Soft Sensor Engine not configured. Initialization skipped.")
@@ -126,7 +180,7 @@ class ServiceAsync:
         Since SiLA and FlightServer are blocking servers, we run them in separate threads
         managed by this async service.
         """
-        if self._gateway_thread and self._gateway_thread.is_alive():
+        if self._gateway_future and not self._gateway_future.done():
             logger.debug("Service already started.")
             return
 
@@ -137,15 +191,12 @@ class ServiceAsync:
 
         self._shutdown_event.clear()
 
-        # Run Gateway in a separate thread
-        # We keep the thread reference to join later if needed,
-        # though these servers are designed to run forever until stopped.
-        self._gateway_thread = threading.Thread(target=self.gateway.start, daemon=True)
-        self._gateway_thread.start()
-
-        # Run Flight Server in a separate thread
-        self._flight_thread = threading.Thread(target=self.flight_server.serve, daemon=True)
-        self._flight_thread.start()
+        # Run the blocking servers on the shared pool. Pool threads are
+        # non-daemon, so shutdown() can wait on the futures after stop();
+        # a daemon thread would be killed mid-RPC on exit, leaving
+        # half-written buffers behind.
+        self._gateway_future = _SERVICE_EXECUTOR.submit(self.gateway.start)
+        self._flight_future = _SERVICE_EXECUTOR.submit(self.flight_server.serve)
 
         logger.info(f"Coreason Signal running: SiLA@{settings.SILA_PORT}, Flight@{settings.ARROW_FLIGHT_PORT}")
 
@@ -198,6 +249,16 @@ class ServiceAsync:
                 # flight_server.shutdown() might be blocking
                 await anyio.to_thread.run_sync(self.flight_server.shutdown)
 
+            # Wait for the server loops so gRPC/Flight can flush in-flight
+            # work and release pooled memory before the threads are handed
+            # back to the pool.
+            for name, future in (("sila-gateway", self._gateway_future), ("flight-server", self._flight_future)):
+                if future and not future.done():
+                    try:
+                        await anyio.to_thread.run_sync(functools.partial(future.result, self._THREAD_JOIN_TIMEOUT))
+                    except FuturesTimeoutError:
+                        logger.warning(f"{name} did not stop within {self._THREAD_JOIN_TIMEOUT}s")
+
         logger.info("Services stopped.")
 
     def ingest_signal(self, data: Dict[str, Any], context: UserContext) -> None:
@@ -215,12 +276,37 @@ class ServiceAsync:
         if self.reflex_engine:
             try:
                 # Attempt to parse as LogEvent and process
-                event = LogEvent(**data)
+                event = LOG_EVENT_ADAPTER.validate_python(data)
                 self.reflex_engine.decide(event, context)
             except Exception as e:
                 # Not a log event or validation failed, just log warning
                 logger.warning(f"Signal data not a valid LogEvent or processing failed: {e}")
 
+    def ingest_signals(self, rows: List[Dict[str, Any]], context: UserContext) -> None:
+        """Ingest a batch of signals/events with identity context.
+
+        The whole batch is validated through the cached list adapter, so
+        pydantic-core walks it with one Python-to-Rust crossing instead of
+        one per event.
+
+        Args:
+            rows (List[Dict[str, Any]]): The signal data rows.
+            context (UserContext): The user context.
+        """
+        if context is None:
+            raise ValueError("UserContext is required.")
+
+        logger.info("Ingesting signal batch", user_id=context.user_id.get_secret_value(), count=len(rows))
+
+        if self.reflex_engine:
+            try:
+                events = LOG_EVENT_LIST_ADAPTER.validate_python(rows)
+            except Exception as e:
+                logger.warning(f"Signal batch not a valid list of LogEvents: {e}")
+                return
+            for event in events:
+                self.reflex_engine.decide(event, context)
+
     def query_signals(self, query: str, top_k: int, context: UserContext) -> List[Any]:
         """Query signals using RAG.
 
@@ -243,7 +329,14 @@ class ServiceAsync:
 
 
 class Service:
-    """Synchronous facade for ServiceAsync."""
+    """Synchronous facade for ServiceAsync.
+
+    Facade calls run on one persistent background event loop instead of a
+    fresh ``anyio.run`` loop per call, so async resources created in
+    ``setup()`` (the httpx connection pool in particular) stay alive across
+    ``start()``/``run_forever()``/``__exit__`` rather than dying with a
+    per-call loop.
+    """
 
     def __init__(self, client: Optional[httpx.AsyncClient] = None) -> None:
         """Initialize the facade.
@@ -253,34 +346,41 @@ class Service:
         """
         self._async_service = ServiceAsync(client=client)
         self._exit_stack: Optional[contextlib.ExitStack] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+
+    def _run_async(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run a coroutine on the persistent background loop and wait for it.
+
+        The loop (and its carrier thread) is created lazily on first use and
+        reused for every subsequent facade call.
+
+        Args:
+            coro (Coroutine[Any, Any, _T]): The coroutine to execute.
+
+        Returns:
+            _T: The coroutine's result.
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(target=self._loop.run_forever, name="service-loop", daemon=True)
+            self._loop_thread.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _stop_loop(self) -> None:
+        """Stop and dispose the background loop, if one was started."""
+        if self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._loop_thread is not None:
+            self._loop_thread.join()
+        self._loop.close()
+        self._loop = None
+        self._loop_thread = None
 
     def __enter__(self) -> "Service":
         """Sync context manager entry."""
-        # We use anyio.run to execute the async setup
-        # However, __enter__ is synchronous. We can't keep an event loop running
-        # across __enter__ and __exit__ easily without a background thread
-        # or just running setup here and cleanup in exit.
-        # But wait, the task says:
-        # "def __enter__(self): return self"
-        # "def __exit__(self, *args): anyio.run(self._async.__aexit__, *args)"
-        # This implies that the loop is started and stopped per method call OR
-        # we rely on methods inside to be wrapped in anyio.run.
-
-        # If we use `async with ServiceAsync()` inside `__enter__` it would close immediately.
-        # We need to manually call setup.
-
-        # The prompt says:
-        # def __enter__(self):
-        #     # Start the event loop for the context?
-        #     # Actually typical sync wrappers either start a loop in a thread
-        #     # OR just use anyio.run for specific calls.
-
-        # If the user does:
-        # with Service() as svc:
-        #    svc.do_something()
-
-        # We need `setup` to have run.
-        anyio.run(self._async_service.setup)
+        self._run_async(self._async_service.setup())
         return self
 
     def __exit__(
@@ -290,11 +390,14 @@ class Service:
         exc_tb: Optional[TracebackType],
     ) -> None:
         """Sync context manager exit."""
-        anyio.run(self._async_service.__aexit__, exc_type, exc_val, exc_tb)
+        try:
+            self._run_async(self._async_service.__aexit__(exc_type, exc_val, exc_tb))
+        finally:
+            self._stop_loop()
 
     def start(self) -> None:
         """Start the services."""
-        anyio.run(self._async_service.start)
+        self._run_async(self._async_service.start())
 
     def run_forever(self, context: Optional[UserContext] = None) -> None:
         """Run the service forever (blocking).
@@ -303,16 +406,20 @@ class Service:
             context (Optional[UserContext]): The identity context.
         """
         try:
-            anyio.run(self._async_service.run_forever, context)
+            self._run_async(self._async_service.run_forever(context))
         except KeyboardInterrupt:
-            # anyio.run might re-raise KeyboardInterrupt or handle it.
-            # We want to ensure graceful shutdown is triggered by __exit__ or here.
+            # Ctrl-C lands here while we block on the future; graceful
+            # shutdown is triggered by __exit__.
             pass
 
     def ingest_signal(self, data: Dict[str, Any], context: UserContext) -> None:
         """Ingest signal."""
         self._async_service.ingest_signal(data, context)
 
+    def ingest_signals(self, rows: List[Dict[str, Any]], context: UserContext) -> None:
+        """Ingest a batch of signals."""
+        self._async_service.ingest_signals(rows, context)
+
     def query_signals(self, query: str, top_k: int, context: UserContext) -> List[Any]:
         """Query signals."""
         return self._async_service.query_signals(query, top_k, context)
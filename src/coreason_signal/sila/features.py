@@ -10,9 +10,18 @@
 
 """Feature registry for dynamic SiLA 2 capability loading."""
 
+import functools
+from typing import Dict
+
 from sila2.framework import Feature
 from sila2.server import FeatureImplementationBase, SilaServer
 
+# Parsed Feature objects keyed by capability name. sila2 validates each
+# definition against the FeatureDefinition XSD on parse, which dwarfs the
+# string-formatting cost; repeated capabilities across gateways reuse the
+# parsed object. Cached Features must be treated as immutable.
+_FEATURE_CACHE: Dict[str, Feature] = {}
+
 
 class GenericFeatureImplementation(FeatureImplementationBase):
     """A generic implementation for dynamically loaded SiLA features.
@@ -31,9 +40,12 @@ class GenericFeatureImplementation(FeatureImplementationBase):
         self.feature_name = feature_name
 
 
+@functools.lru_cache(maxsize=128)
 def generate_minimal_feature_xml(feature_name: str) -> str:
     """Generates a valid, minimal SiLA Feature Definition XML.
 
+    Memoized: the same capability name always yields the same definition.
+
     Args:
         feature_name (str): Name of the feature.
 
@@ -58,14 +70,20 @@ class FeatureRegistry:
     def create_feature(feature_name: str) -> Feature:
         """Create a SiLA Feature object from a name.
 
+        Repeated names return the cached parsed Feature, skipping the XML
+        parse and XSD validation.
+
         Args:
             feature_name (str): Name of the feature.
 
         Returns:
             Feature: The constructed SiLA Feature object.
         """
-        xml_def = generate_minimal_feature_xml(feature_name)
-        return Feature(feature_definition=xml_def)
+        feature = _FEATURE_CACHE.get(feature_name)
+        if feature is None:
+            feature = Feature(feature_definition=generate_minimal_feature_xml(feature_name))
+            _FEATURE_CACHE[feature_name] = feature
+        return feature
 
     @staticmethod
     def create_implementation(server: SilaServer, feature_name: str) -> FeatureImplementationBase:
@@ -8,7 +8,9 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_signal
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
+from urllib.parse import urlsplit
 
 from coreason_identity.models import UserContext
 from sila2.server import SilaServer
@@ -52,9 +54,10 @@ class SiLAGateway:
         self.arrow_flight_port = arrow_flight_port
 
         # Parse endpoint to extract host and port for SiLA
-        # HttpUrl in Pydantic v2 has .host and .port attributes (or .host_str for ipv6)
-        self.host = self.device_def.endpoint.host
-        self.port = self.device_def.endpoint.port or DEFAULT_SILA_PORT
+        # The endpoint is a regex-validated str; urlsplit handles IPv6 brackets.
+        parts = urlsplit(self.device_def.endpoint)
+        self.host = parts.hostname
+        self.port = parts.port or DEFAULT_SILA_PORT
 
         logger.info(f"Initializing SiLAGateway for {self.device_def.id} on {self.host}:{self.port}")
         logger.info(f"Sidecar Arrow Flight Port configured at: {self.arrow_flight_port}")
@@ -73,12 +76,26 @@ class SiLAGateway:
         self._load_capabilities()
 
     def _load_capabilities(self) -> None:
-        """Dynamically generate and register SiLA features based on device capabilities."""
-        for capability in self.device_def.capabilities:
+        """Dynamically generate and register SiLA features based on device capabilities.
+
+        Feature definitions are parsed in a thread pool: the XML parse and XSD
+        validation inside sila2 are C-backed and release the GIL, so uncached
+        capabilities overlap instead of serializing startup. Registration with
+        the server stays single-threaded, and a failure in one capability
+        still only skips that capability.
+        """
+        capabilities = self.device_def.capabilities
+        if not capabilities:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(8, len(capabilities))) as executor:
+            futures = [executor.submit(FeatureRegistry.create_feature, cap) for cap in capabilities]
+
+        for capability, future in zip(capabilities, futures, strict=True):
             logger.info(f"Dynamically loading capability: {capability}")
             try:
-                # 1. Create Feature Definition
-                feature_def = FeatureRegistry.create_feature(capability)
+                # 1. Feature Definition (parsed concurrently above)
+                feature_def = future.result()
 
                 # 2. Create Implementation
                 impl = FeatureRegistry.create_implementation(self.server, capability)
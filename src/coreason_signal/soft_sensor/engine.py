@@ -155,5 +155,6 @@ class SoftSensorEngine:
             new_constraints (Dict[str, float]): New constraints to apply.
         """
         logger.info(f"Updating physics constraints for {self.config.id}: {new_constraints}")
-        self.config.physics_constraints = new_constraints
+        # SoftSensorModel is frozen; swap in a copy instead of mutating in place.
+        self.config = self.config.model_copy(update={"physics_constraints": new_constraints})
         self._constraints = self._parse_constraints()
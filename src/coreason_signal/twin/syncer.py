@@ -9,13 +9,43 @@
 # Source Code: https://github.com/CoReason-AI/coreason_signal
 
 import math
+import sys
 import threading
-from collections import defaultdict
-from typing import Any, Callable, Dict, List, Optional, Protocol
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Protocol, Sequence, Tuple
+
+import numpy as np
 
 from coreason_signal.schemas import SemanticFact, TwinUpdate
 from coreason_signal.utils.logger import logger
 
+# Shared result for the no-facts case; returned instead of allocating a
+# fresh empty list per sync. Pydantic coerces the tuple when building the
+# TwinUpdate, so callers never mutate it.
+_NO_FACTS: Tuple[SemanticFact, ...] = ()
+
+
+def _delta_ok(value: float, last: float, threshold: float, zero_tolerance: float = 1e-6) -> bool:
+    """Scalar change-detection predicate for the per-sample hot path.
+
+    Module-level so the per-call cost is a plain function call with no
+    bound-method or attribute dispatch; uses a single isfinite check per
+    operand instead of separate isnan/isinf calls.
+
+    Args:
+        value (float): The incoming value.
+        last (float): The last synced value.
+        threshold (float): The percentage threshold for change.
+        zero_tolerance (float): Small epsilon to handle near-zero values.
+
+    Returns:
+        bool: True if the change is significant.
+    """
+    if not math.isfinite(value) or not math.isfinite(last):
+        return True  # Always sync anomalies and recoveries
+    if abs(last) < zero_tolerance:
+        return abs(value - last) > zero_tolerance
+    return abs(value - last) / abs(last) >= threshold
+
 
 class GraphConnector(Protocol):
     """Protocol for the external Graph Nexus connector."""
@@ -55,11 +85,20 @@ class TwinSyncer:
         self.default_sigma_threshold = default_sigma_threshold
         self._lock = threading.RLock()
 
-        # Cache structure: {entity_id: {property_name: last_synced_value}}
-        self._last_synced_state: Dict[str, Dict[str, float]] = {}
-
-        # Fact rules: {property_name: [rule_function]}
-        self._fact_rules: Dict[str, List[Callable[[str, Any], Optional[SemanticFact]]]] = defaultdict(list)
+        # Structure-of-arrays state cache: last synced values live in one
+        # contiguous float64 array, addressed through a (entity_id,
+        # property_name) -> slot table. Costs ~8 bytes per entry instead of
+        # nested dicts of boxed floats, and batch reads become a single
+        # NumPy gather. The array grows geometrically; slots are never freed.
+        self._slot: Dict[Tuple[str, str], int] = {}
+        self._last: np.ndarray = np.empty(0, dtype=np.float64)
+
+        # Fact rules: {property_name: (rule_function, ...)}. Stored as
+        # immutable tuples replaced wholesale under the lock, so readers can
+        # dispatch without locking or copying; _rule_properties gives the
+        # dominant "no rules for this property" case an O(1) fast reject.
+        self._fact_rules: Dict[str, Tuple[Callable[[str, Any], Optional[SemanticFact]], ...]] = {}
+        self._rule_properties: FrozenSet[str] = frozenset()
 
     def register_fact_rule(self, property_name: str, rule: Callable[[str, Any], Optional[SemanticFact]]) -> None:
         """Register a rule to derive semantic facts from a property.
@@ -69,8 +108,42 @@ class TwinSyncer:
             rule (Callable[[str, Any], Optional[SemanticFact]]): A function taking (entity_id, value)
                 and returning a SemanticFact or None.
         """
+        property_name = sys.intern(property_name)
         with self._lock:
-            self._fact_rules[property_name].append(rule)
+            self._fact_rules[property_name] = (*self._fact_rules.get(property_name, ()), rule)
+            self._rule_properties = frozenset(self._fact_rules)
+
+    def _get_last(self, entity_id: str, property_name: str) -> Optional[float]:
+        """Look up the last synced value for a key.
+
+        Args:
+            entity_id (str): The entity ID.
+            property_name (str): The property name.
+
+        Returns:
+            Optional[float]: The last synced value, or None if never synced.
+        """
+        slot = self._slot.get((entity_id, property_name))
+        return None if slot is None else float(self._last[slot])
+
+    def _store_last(self, entity_id: str, property_name: str, value: float) -> None:
+        """Record a synced value, allocating a slot on first sight of the key.
+
+        Args:
+            entity_id (str): The entity ID.
+            property_name (str): The property name.
+            value (float): The value that was synced.
+        """
+        key = (entity_id, property_name)
+        slot = self._slot.get(key)
+        if slot is None:
+            slot = len(self._slot)
+            if slot >= self._last.shape[0]:
+                grown = np.empty(max(16, self._last.shape[0] * 2), dtype=np.float64)
+                grown[: self._last.shape[0]] = self._last
+                self._last = grown
+            self._slot[key] = slot
+        self._last[slot] = value
 
     @staticmethod
     def _is_significant_change(
@@ -89,20 +162,36 @@ class TwinSyncer:
         Returns:
             bool: True if the change is significant, False otherwise.
         """
-        # 1. NaN/Inf handling
-        if math.isnan(new_value) or math.isinf(new_value):
-            return True  # Always sync anomaly
-        if math.isnan(old_value) or math.isinf(old_value):
-            return True  # Always sync recovery from anomaly
+        return _delta_ok(new_value, old_value, threshold, zero_tolerance)
+
+    @staticmethod
+    def _significant_mask(
+        last_values: "np.ndarray", new_values: "np.ndarray", threshold: float, zero_tolerance: float = 1e-6
+    ) -> "np.ndarray":
+        """Vectorized counterpart of :meth:`_is_significant_change`.
 
-        # 2. Zero handling
-        if abs(old_value) < zero_tolerance:
-            # If old was ~0, any change > tolerance is significant
-            return abs(new_value - old_value) > zero_tolerance
+        Computes the change-detection mask for a whole batch in a handful of
+        NumPy expressions instead of one Python-level comparison per reading.
+        Missing last-synced values should be encoded as NaN; the non-finite
+        branch then marks them as significant, matching the first-value rule.
 
-        # 3. Relative change
-        delta = abs(new_value - old_value) / abs(old_value)
-        return delta >= threshold
+        Args:
+            last_values (np.ndarray): Last synced values (NaN where unknown).
+            new_values (np.ndarray): Incoming values, same shape.
+            threshold (float): The percentage threshold for change.
+            zero_tolerance (float): Small epsilon to handle near-zero values.
+
+        Returns:
+            np.ndarray: Boolean mask, True where the change is significant.
+        """
+        with np.errstate(invalid="ignore"):
+            abs_last = np.abs(last_values)
+            abs_change = np.abs(new_values - last_values)
+            near_zero = abs_last < zero_tolerance
+            deltas = abs_change / np.where(near_zero, 1.0, abs_last)
+            mask: "np.ndarray" = np.where(near_zero, abs_change > zero_tolerance, deltas >= threshold)
+            mask |= ~np.isfinite(new_values) | ~np.isfinite(last_values)
+        return mask
 
     def _should_sync(self, entity_id: str, property_name: str, value: float, threshold: float) -> bool:
         """Check if the value change is significant enough to sync.
@@ -118,19 +207,14 @@ class TwinSyncer:
         Returns:
             bool: True if sync is required.
         """
-        # Always sync special values (NaN, Inf) if we don't know the state
-        if math.isnan(value) or math.isinf(value):
-            return True
-
-        if entity_id not in self._last_synced_state:
-            return True  # Always sync first value
-
-        if property_name not in self._last_synced_state[entity_id]:
-            return True  # Always sync first value for this property
+        # Cache-miss check first; _delta_ok's single isfinite test per
+        # operand already returns True for NaN/Inf values, so the dominant
+        # finite path pays no separate isnan/isinf pre-checks here.
+        slot = self._slot.get((entity_id, property_name))
+        if slot is None:
+            return True  # Always sync first value for this key
 
-        last_value = self._last_synced_state[entity_id][property_name]
-
-        return self._is_significant_change(last_value, value, threshold)
+        return _delta_ok(value, float(self._last[slot]), threshold)
 
     def sync_state(
         self,
@@ -155,21 +239,29 @@ class TwinSyncer:
         Returns:
             bool: True if sync occurred, False if throttled or failed.
         """
+        # Keys arrive as fresh str objects from gRPC/Flight messages; intern
+        # them so slot-table lookups hit the pointer-equality fast path.
+        # Callers that can pass already-interned strings should do so.
+        entity_id = sys.intern(entity_id)
+        property_name = sys.intern(property_name)
+
         eff_threshold = threshold if threshold is not None else self.default_sigma_threshold
 
         with self._lock:
             if not self._should_sync(entity_id, property_name, value, eff_threshold):
-                logger.debug(f"Throttled update for {entity_id}.{property_name}: {value}")
+                # Deferred {}-style formatting: loguru skips interpolation when
+                # no sink accepts the record, so throttled calls cost no string work.
+                logger.debug("Throttled update for {}.{}: {}", entity_id, property_name, value)
                 return False
 
-        # Fact Promotion (can run outside lock if rules are thread-safe, but accessing rules list needs lock if dynamic)
-        # For safety, let's copy the rules list under lock or just run it. The lock is RLock so re-entry is fine.
-        # However, calling external code under lock is generally bad (deadlocks).
-        # We will fetch rules under lock, run outside.
-        with self._lock:
-            rules = list(self._fact_rules.get(property_name, []))
-
-        facts = self._derive_facts_from_rules(rules, entity_id, value, property_name)
+        # Fact Promotion: rule tuples are immutable and swapped atomically by
+        # register_fact_rule, so dispatch needs no lock or defensive copy, and
+        # the frozenset membership test rejects rule-less properties without
+        # touching the rules dict at all.
+        if property_name in self._rule_properties:
+            facts = self._derive_facts_from_rules(self._fact_rules[property_name], entity_id, value, property_name)
+        else:
+            facts = _NO_FACTS
 
         # Create Update Payload
         update = TwinUpdate(
@@ -182,43 +274,119 @@ class TwinSyncer:
         # Sync (Network Call - Do NOT hold lock)
         try:
             self.connector.update_node(update)
-            logger.info(f"Synced {entity_id}.{property_name} = {value} ({len(facts)} facts)")
+            logger.info("Synced {}.{} = {} ({} facts)", entity_id, property_name, value, len(facts))
 
             # Update cache AFTER successful sync
             with self._lock:
-                if entity_id not in self._last_synced_state:
-                    self._last_synced_state[entity_id] = {}
-                self._last_synced_state[entity_id][property_name] = value
+                self._store_last(entity_id, property_name, value)
 
             return True
         except Exception as e:
             logger.error(f"Failed to sync twin update for {entity_id}: {e}")
             return False
 
+    def sync_state_many(
+        self,
+        entity_id: str,
+        properties: Dict[str, float],
+        timestamp: str,
+        threshold: Optional[float] = None,
+    ) -> int:
+        """Sync a batch of property readings for one entity in a single update.
+
+        The throttling decision for the whole batch is made with one
+        vectorized mask (:meth:`_significant_mask`) rather than per-property
+        Python checks, and all significant properties are pushed to the Graph
+        Nexus in a single TwinUpdate instead of one network call each.
+
+        Args:
+            entity_id (str): The ID of the entity (e.g., "Bioreactor-01").
+            properties (Dict[str, float]): Mapping of property name to new value.
+            timestamp (str): ISO 8601 timestamp.
+            threshold (Optional[float]): Optional override for sigma threshold.
+
+        Returns:
+            int: Number of properties synced (0 if fully throttled or failed).
+        """
+        if not properties:
+            return 0
+
+        eff_threshold = threshold if threshold is not None else self.default_sigma_threshold
+
+        entity_id = sys.intern(entity_id)
+        names = [sys.intern(name) for name in properties]
+        values = np.fromiter((properties[name] for name in names), dtype=np.float64, count=len(names))
+
+        with self._lock:
+            # One gather from the SoA cache; -1 marks unseen keys, which are
+            # rewritten to NaN so the non-finite branch of the mask fires.
+            slots = np.fromiter(
+                (self._slot.get((entity_id, name), -1) for name in names), dtype=np.int64, count=len(names)
+            )
+            last = self._last[slots] if self._slot else np.empty(len(names), dtype=np.float64)
+            last[slots < 0] = math.nan
+
+        mask = self._significant_mask(last, values, eff_threshold)
+        if not mask.any():
+            logger.debug("Throttled batch update for {}: {} properties unchanged", entity_id, len(names))
+            return 0
+
+        changed = {names[i]: float(values[i]) for i in np.nonzero(mask)[0]}
+
+        facts: List[SemanticFact] = []
+        for name, value in changed.items():
+            if name in self._rule_properties:
+                facts.extend(self._derive_facts_from_rules(self._fact_rules[name], entity_id, value, name))
+
+        update = TwinUpdate(
+            entity_id=entity_id,
+            timestamp=timestamp,
+            properties=changed,
+            derived_facts=facts,
+        )
+
+        try:
+            self.connector.update_node(update)
+            logger.info("Synced {}: {}/{} properties ({} facts)", entity_id, len(changed), len(names), len(facts))
+
+            with self._lock:
+                for name, new_value in changed.items():
+                    self._store_last(entity_id, name, new_value)
+
+            return len(changed)
+        except Exception as e:
+            logger.error(f"Failed to sync twin batch update for {entity_id}: {e}")
+            return 0
+
     def _derive_facts_from_rules(
         self,
-        rules: List[Callable[[str, Any], Optional[SemanticFact]]],
+        rules: Tuple[Callable[[str, Any], Optional[SemanticFact]], ...],
         entity_id: str,
         value: float,
         property_name: str,
-    ) -> List[SemanticFact]:
+    ) -> Sequence[SemanticFact]:
         """Apply rules to derive facts.
 
+        The result list is allocated lazily: when no rule fires, the shared
+        empty _NO_FACTS sentinel is returned instead of a fresh list.
+
         Args:
-            rules (List[Callable]): List of rule functions.
+            rules (Tuple[Callable, ...]): Rule functions for the property.
             entity_id (str): The entity ID.
             value (float): The current value.
             property_name (str): The property name.
 
         Returns:
-            List[SemanticFact]: A list of derived facts.
+            Sequence[SemanticFact]: The derived facts (possibly empty).
         """
-        facts: List[SemanticFact] = []
+        facts: Optional[List[SemanticFact]] = None
         for rule in rules:
             try:
                 fact = rule(entity_id, value)
                 if fact:
+                    if facts is None:
+                        facts = []
                     facts.append(fact)
             except Exception as e:
                 logger.warning(f"Fact rule failed for {property_name}: {e}")
-        return facts
+        return facts if facts is not None else _NO_FACTS
@@ -4,11 +4,53 @@ import sys
 # Ensure local mock libs are available for tests if real package is missing
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "libs")))
 
+from typing import Iterator
+from unittest.mock import MagicMock
+
 import pytest
 from coreason_identity.models import UserContext
 from coreason_identity.types import SecretStr
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def user_context() -> UserContext:
+    """One UserContext for the whole session.
+
+    Validation (SecretStr wrapping included) runs once; tests treat the
+    context as read-only, so sharing it is safe.
+    """
     return UserContext(user_id=SecretStr("test-user"), roles=["tester"], metadata={"env": "test"})
+
+
+@pytest.fixture(scope="session")
+def _vector_store_session() -> MagicMock:
+    """One vector store mock for the whole session; built once, reset per test."""
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_vector_store(_vector_store_session: MagicMock) -> MagicMock:
+    """Per-test view of the session vector store mock.
+
+    reset_mock clears call history plus configured return values and side
+    effects, so tests stay isolated without paying MagicMock construction
+    for every function.
+    """
+    _vector_store_session.reset_mock(return_value=True, side_effect=True)
+    return _vector_store_session
+
+
+@pytest.fixture(autouse=True)
+def clear_embedding_model_cache() -> Iterator[None]:
+    """Isolate the process-wide embedding model cache between tests.
+
+    Tests patch TextEmbedding with per-test mocks; without clearing, a mock
+    cached by one test would leak into the next. The same applies to the
+    service-level vector store cache.
+    """
+    from coreason_signal import service
+    from coreason_signal.edge_agent import vector_store
+
+    vector_store._MODEL_CACHE.clear()
+    service._VECTOR_STORE_CACHE.clear()
+    yield
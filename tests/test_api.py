@@ -8,21 +8,45 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_signal
 
-from typing import Generator
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from typing import AsyncIterator, Generator
+from unittest.mock import AsyncMock, MagicMock, Mock
 
+import orjson
 import pytest
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
 from coreason_signal.api import app, lifespan
 from coreason_signal.schemas import DeviceDefinition
 
 
+def _j(body: object) -> dict:
+    """Request kwargs for an orjson-encoded JSON body.
+
+    Skips httpx's stdlib json.dumps and exercises the same explicit
+    content-type path production clients use.
+    """
+    return {"content": orjson.dumps(body), "headers": {"content-type": "application/json"}}
+
+
+# Validated once at import: the definition is frozen, so every mock_service
+# can share this instance instead of re-running pydantic validation per test.
+_DEVICE_DEF = DeviceDefinition(
+    id="test-device",
+    driver_type="SiLA2",
+    endpoint="http://localhost:50052",
+    capabilities=[],
+    edge_agent_model="test",
+    allowed_reflexes=[],
+)
+
+
 @pytest.fixture
 def mock_service() -> Generator[MagicMock, None, None]:
     """Fixture to provide a mocked ServiceAsync instance."""
     # We avoid spec=ServiceAsync to prevent auto-creation of MagicMocks for methods
     # that might conflict with our explicit AsyncMock assignment.
+    # Function-scoped because several tests mutate .gateway/.flight_server.
     service_mock = MagicMock()
 
     # Async methods need AsyncMock
@@ -30,21 +54,16 @@ def mock_service() -> Generator[MagicMock, None, None]:
     service_mock.start = AsyncMock(return_value=None)
     service_mock.shutdown = AsyncMock(return_value=None)
 
-    # Setup attributes required by endpoints
-    service_mock.gateway = MagicMock()
-    service_mock.gateway.device_def = DeviceDefinition(
-        id="test-device",
-        driver_type="SiLA2",
-        endpoint="http://localhost:50052",
-        capabilities=[],
-        edge_agent_model="test",
-        allowed_reflexes=[],
+    # Setup attributes required by endpoints. The gateway and flight server
+    # only expose data attributes plus one stubbed method, so plain
+    # SimpleNamespace leaves skip MagicMock's lazy child-mock machinery on
+    # every endpoint hit; the engines stay MagicMock because tests assert
+    # on their call records.
+    service_mock.gateway = SimpleNamespace(device_def=_DEVICE_DEF, port=50052)
+    service_mock.flight_server = SimpleNamespace(
+        location="grpc://localhost:50055",
+        get_latest_data=Mock(return_value=[]),
     )
-    service_mock.gateway.port = 50052
-
-    service_mock.flight_server = MagicMock()
-    service_mock.flight_server.location = "grpc://localhost:50055"
-    service_mock.flight_server.get_latest_data.return_value = []
 
     service_mock.reflex_engine = MagicMock()
     service_mock.soft_sensor_engine = MagicMock()
@@ -53,16 +72,19 @@ def mock_service() -> Generator[MagicMock, None, None]:
 
 
 @pytest.fixture
-def client(mock_service: MagicMock) -> Generator[TestClient, None, None]:
-    # Inject the mock service into the app state
+async def client(mock_service: MagicMock) -> AsyncIterator[AsyncClient]:
+    """ASGI-level client: requests run on the test's event loop with no
+    per-request thread hop, and no server lifespan cycle per test. Lifespan
+    behavior is covered separately by the test_lifespan_* tests."""
+    # Inject this test's mock service into the app state
     app.state.service = mock_service
-    with TestClient(app) as client:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         yield client
 
 
-def test_status_endpoint(client: TestClient) -> None:
+async def test_status_endpoint(client: AsyncClient) -> None:
     """Test GET /status endpoint."""
-    response = client.get("/status")
+    response = await client.get("/status")
     assert response.status_code == 200
     data = response.json()
     assert data["device_id"] == "test-device"
@@ -70,38 +92,38 @@ def test_status_endpoint(client: TestClient) -> None:
     assert data["status"] == "active"
 
 
-def test_status_endpoint_not_initialized(client: TestClient) -> None:
+async def test_status_endpoint_not_initialized(client: AsyncClient) -> None:
     """Test GET /status when service is not ready."""
     # Temporarily remove service
     app.state.service = None
-    response = client.get("/status")
+    response = await client.get("/status")
     assert response.status_code == 503
 
 
-def test_status_endpoint_gateway_not_ready(client: TestClient, mock_service: MagicMock) -> None:
+async def test_status_endpoint_gateway_not_ready(client: AsyncClient, mock_service: MagicMock) -> None:
     """Test GET /status when gateway is not ready."""
     # Gateway is None
     mock_service.gateway = None
-    response = client.get("/status")
+    response = await client.get("/status")
     assert response.status_code == 503
 
     # Gateway def is None
     mock_service.gateway = MagicMock()
     mock_service.gateway.device_def = None
-    response = client.get("/status")
+    response = await client.get("/status")
     assert response.status_code == 503
 
 
-def test_latest_sensors_endpoint(client: TestClient) -> None:
+async def test_latest_sensors_endpoint(client: AsyncClient) -> None:
     """Test GET /sensors/latest endpoint."""
-    response = client.get("/sensors/latest")
+    response = await client.get("/sensors/latest")
     assert response.status_code == 200
     data = response.json()
     assert data["buffered_batches_count"] == 0
     assert data["batches"] == []
 
 
-def test_latest_sensors_with_data(client: TestClient, mock_service: MagicMock) -> None:
+async def test_latest_sensors_with_data(client: AsyncClient, mock_service: MagicMock) -> None:
     """Test GET /sensors/latest with data in buffer."""
     batch_mock = MagicMock()
     batch_mock.num_rows = 10
@@ -111,7 +133,7 @@ def test_latest_sensors_with_data(client: TestClient, mock_service: MagicMock) -
 
     mock_service.flight_server.get_latest_data.return_value = [batch_mock]
 
-    response = client.get("/sensors/latest")
+    response = await client.get("/sensors/latest")
     assert response.status_code == 200
     data = response.json()
     assert data["buffered_batches_count"] == 1
@@ -119,80 +141,100 @@ def test_latest_sensors_with_data(client: TestClient, mock_service: MagicMock) -
     assert data["batches"][0]["schema"] == "Schema<foo: int32>"
 
 
-def test_latest_sensors_endpoint_error(client: TestClient, mock_service: MagicMock) -> None:
+async def test_latest_sensors_shared_schema(client: AsyncClient, mock_service: MagicMock) -> None:
+    """Test GET /sensors/latest renders a shared schema once across batches."""
+    batches = []
+    for rows in (10, 20):
+        batch_mock = MagicMock()
+        batch_mock.num_rows = rows
+        batch_mock.num_columns = 5
+        batch_mock.schema = "Schema<foo: int32>"
+        batch_mock.nbytes = 100
+        batches.append(batch_mock)
+
+    mock_service.flight_server.get_latest_data.return_value = batches
+
+    response = await client.get("/sensors/latest")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["buffered_batches_count"] == 2
+    assert [b["num_rows"] for b in data["batches"]] == [10, 20]
+    assert {b["schema"] for b in data["batches"]} == {"Schema<foo: int32>"}
+
+
+async def test_latest_sensors_endpoint_error(client: AsyncClient, mock_service: MagicMock) -> None:
     """Test GET /sensors/latest handles exceptions."""
     mock_service.flight_server.get_latest_data.side_effect = RuntimeError("Flight Error")
-    response = client.get("/sensors/latest")
+    response = await client.get("/sensors/latest")
     assert response.status_code == 500
     assert "Flight Error" in response.json()["detail"]
 
 
-def test_latest_sensors_flight_server_missing(client: TestClient, mock_service: MagicMock) -> None:
+async def test_latest_sensors_flight_server_missing(client: AsyncClient, mock_service: MagicMock) -> None:
     """Test GET /sensors/latest when flight server is missing."""
     mock_service.flight_server = None
-    response = client.get("/sensors/latest")
+    response = await client.get("/sensors/latest")
     assert response.status_code == 503
 
 
-def test_latest_sensors_service_not_initialized(client: TestClient) -> None:
+async def test_latest_sensors_service_not_initialized(client: AsyncClient) -> None:
     """Test GET /sensors/latest when service is not initialized."""
     app.state.service = None
-    response = client.get("/sensors/latest")
+    response = await client.get("/sensors/latest")
     assert response.status_code == 503
 
 
-def test_trigger_reflex_endpoint(client: TestClient, mock_service: MagicMock) -> None:
+async def test_trigger_reflex_endpoint(client: AsyncClient, mock_service: MagicMock) -> None:
     """Test POST /reflex/trigger endpoint."""
     payload = {"action": "TEST_ACTION", "parameters": {"speed": 100}, "reasoning": "Manual Trigger"}
-    response = client.post("/reflex/trigger", json=payload)
+    response = await client.post("/reflex/trigger", **_j(payload))
     assert response.status_code == 200
     assert response.json()["status"] == "triggered"
     mock_service.reflex_engine.trigger.assert_called_once()
 
 
-def test_trigger_reflex_not_available(client: TestClient, mock_service: MagicMock) -> None:
+async def test_trigger_reflex_not_available(client: AsyncClient, mock_service: MagicMock) -> None:
     """Test POST /reflex/trigger when engine is missing."""
     mock_service.reflex_engine = None
     payload = {"action": "TEST", "parameters": {}, "reasoning": "test"}
-    response = client.post("/reflex/trigger", json=payload)
+    response = await client.post("/reflex/trigger", **_j(payload))
     assert response.status_code == 503
 
 
-def test_update_constraints_endpoint(client: TestClient, mock_service: MagicMock) -> None:
+async def test_update_constraints_endpoint(client: AsyncClient, mock_service: MagicMock) -> None:
     """Test PUT /soft-sensor/constraints endpoint."""
     constraints = {"min_temp": 10.0, "max_temp": 90.0}
-    response = client.put("/soft-sensor/constraints", json=constraints)
+    response = await client.put("/soft-sensor/constraints", **_j(constraints))
     assert response.status_code == 200
     assert response.json()["status"] == "updated"
     mock_service.soft_sensor_engine.update_constraints.assert_called_with(constraints)
 
 
-def test_update_constraints_not_available(client: TestClient, mock_service: MagicMock) -> None:
+async def test_update_constraints_not_available(client: AsyncClient, mock_service: MagicMock) -> None:
     """Test PUT /soft-sensor/constraints when engine is missing."""
     mock_service.soft_sensor_engine = None
     constraints = {"min_temp": 10.0}
-    response = client.put("/soft-sensor/constraints", json=constraints)
+    response = await client.put("/soft-sensor/constraints", **_j(constraints))
     assert response.status_code == 503
 
 
-def test_update_constraints_error(client: TestClient, mock_service: MagicMock) -> None:
+async def test_update_constraints_error(client: AsyncClient, mock_service: MagicMock) -> None:
     """Test PUT /soft-sensor/constraints handles exceptions."""
     mock_service.soft_sensor_engine.update_constraints.side_effect = ValueError("Invalid Constraint")
     constraints = {"min_temp": 10.0}
-    response = client.put("/soft-sensor/constraints", json=constraints)
+    response = await client.put("/soft-sensor/constraints", **_j(constraints))
     assert response.status_code == 400
     assert "Invalid Constraint" in response.json()["detail"]
 
 
-def test_update_constraints_service_not_initialized(client: TestClient) -> None:
+async def test_update_constraints_service_not_initialized(client: AsyncClient) -> None:
     """Test PUT /soft-sensor/constraints when service is None."""
     app.state.service = None
     constraints = {"min_temp": 10.0}
-    response = client.put("/soft-sensor/constraints", json=constraints)
+    response = await client.put("/soft-sensor/constraints", **_j(constraints))
     assert response.status_code == 503
 
 
-@pytest.mark.asyncio
 async def test_lifespan_no_service() -> None:
     """Test lifespan startup when service is missing in state."""
     mock_app = MagicMock(spec=app)
@@ -202,3 +244,16 @@ async def test_lifespan_no_service() -> None:
     async with lifespan(mock_app):
         pass
     # No assertion needed other than it didn't raise
+
+
+async def test_lifespan_with_service(mock_service: MagicMock) -> None:
+    """Test lifespan drives service setup/start/shutdown."""
+    mock_app = MagicMock(spec=app)
+    mock_app.state.service = mock_service
+
+    async with lifespan(mock_app):
+        mock_service.setup.assert_awaited_once()
+        mock_service.start.assert_awaited_once()
+        mock_service.shutdown.assert_not_awaited()
+
+    mock_service.shutdown.assert_awaited_once()
@@ -1,18 +1,18 @@
-import datetime
 from unittest.mock import MagicMock
 
-import pytest
+from coreason_identity.models import UserContext
 
 from coreason_signal.edge_agent.reflex_engine import ReflexEngine
 from coreason_signal.schemas import LogEvent, SOPDocument
 
+# 10KB message built once at import rather than per test
+_LONG_MESSAGE = "ERROR_CODE_X " * 1000
 
-@pytest.fixture
-def mock_vector_store() -> MagicMock:
-    return MagicMock()
+# Validated once; variants derive via model_copy, skipping re-validation
+_ERROR_EVENT = LogEvent(id="evt", level="ERROR", source="test", message="m")
 
 
-def test_unicode_log_event(mock_vector_store: MagicMock) -> None:
+def test_unicode_log_event(mock_vector_store: MagicMock, user_context: UserContext) -> None:
     """
     Test handling of log events containing Unicode characters and emojis.
     Verifies that the text is passed correctly to the vector store query.
@@ -21,25 +21,15 @@ def test_unicode_log_event(mock_vector_store: MagicMock) -> None:
     mock_vector_store.query.return_value = []
 
     unicode_message = "🔥 Engine Overheat Error: 溫度过高 (Temperature too high)"
-    event = LogEvent(
-        id="evt-unicode",
-        timestamp=datetime.datetime.now().isoformat(),
-        level="ERROR",
-        source="Bioreactor-β",
-        message=unicode_message,
-    )
-
-    from coreason_identity.models import UserContext
-    from coreason_identity.types import SecretStr
+    event = _ERROR_EVENT.model_copy(update={"id": "evt-unicode", "source": "Bioreactor-β", "message": unicode_message})
 
-    ctx = UserContext(user_id=SecretStr("sys"), roles=["system"], metadata={})
-    engine.decide(event, ctx)
+    engine.decide(event, user_context)
 
     # Ensure the exact unicode string was passed to the query
     mock_vector_store.query.assert_called_once_with(unicode_message, k=1)
 
 
-def test_long_log_message(mock_vector_store: MagicMock) -> None:
+def test_long_log_message(mock_vector_store: MagicMock, user_context: UserContext) -> None:
     """
     Test handling of extremely long log messages.
     Ensures that the system does not crash and attempts to query.
@@ -47,26 +37,14 @@ def test_long_log_message(mock_vector_store: MagicMock) -> None:
     engine = ReflexEngine(vector_store=mock_vector_store)
     mock_vector_store.query.return_value = []
 
-    # Create a 10KB message
-    long_message = "ERROR_CODE_X " * 1000
-    event = LogEvent(
-        id="evt-long",
-        timestamp=datetime.datetime.now().isoformat(),
-        level="ERROR",
-        source="Sequencer",
-        message=long_message,
-    )
-
-    from coreason_identity.models import UserContext
-    from coreason_identity.types import SecretStr
+    event = _ERROR_EVENT.model_copy(update={"id": "evt-long", "source": "Sequencer", "message": _LONG_MESSAGE})
 
-    ctx = UserContext(user_id=SecretStr("sys"), roles=["system"], metadata={})
-    engine.decide(event, ctx)
+    engine.decide(event, user_context)
 
-    mock_vector_store.query.assert_called_once_with(long_message, k=1)
+    mock_vector_store.query.assert_called_once_with(_LONG_MESSAGE, k=1)
 
 
-def test_sop_recovery_partial_data(mock_vector_store: MagicMock) -> None:
+def test_sop_recovery_partial_data(mock_vector_store: MagicMock, user_context: UserContext) -> None:
     """
     Test scenario where the Vector Store returns a valid SOP match,
     but that SOP triggers an internal logic edge case (like missing reflex).
@@ -83,19 +61,11 @@ def test_sop_recovery_partial_data(mock_vector_store: MagicMock) -> None:
     )
     mock_vector_store.query.return_value = [sop]
 
-    event = LogEvent(
-        id="evt-partial",
-        timestamp=datetime.datetime.now().isoformat(),
-        level="ERROR",
-        source="Centrifuge",
-        message="Vibration detected",
+    event = _ERROR_EVENT.model_copy(
+        update={"id": "evt-partial", "source": "Centrifuge", "message": "Vibration detected"}
     )
 
-    from coreason_identity.models import UserContext
-    from coreason_identity.types import SecretStr
-
-    ctx = UserContext(user_id=SecretStr("sys"), roles=["system"], metadata={})
-    reflex = engine.decide(event, ctx)
+    reflex = engine.decide(event, user_context)
 
     assert reflex is not None
     assert reflex.action == "NOTIFY"
@@ -103,7 +73,9 @@ def test_sop_recovery_partial_data(mock_vector_store: MagicMock) -> None:
     assert reflex.parameters["sop_id"] == "SOP-Minimal"
 
 
-def test_vector_store_returns_invalid_type_graceful_fail(mock_vector_store: MagicMock) -> None:
+def test_vector_store_returns_invalid_type_graceful_fail(
+    mock_vector_store: MagicMock, user_context: UserContext
+) -> None:
     """
     Test scenario where the vector store query returns an object that is NOT an SOPDocument
     (e.g., if dynamic typing goes wrong or mock is bad).
@@ -116,19 +88,9 @@ def test_vector_store_returns_invalid_type_graceful_fail(mock_vector_store: Magi
     # This simulates a potential issue if the vector store layer failed to validate/convert.
     mock_vector_store.query.return_value = [{"id": "bad", "title": "bad"}]  # Not an object
 
-    event = LogEvent(
-        id="evt-type-fail",
-        timestamp=datetime.datetime.now().isoformat(),
-        level="ERROR",
-        source="Mixer",
-        message="Speed error",
-    )
+    event = _ERROR_EVENT.model_copy(update={"id": "evt-type-fail", "source": "Mixer", "message": "Speed error"})
 
     # Updated expectation: The engine is now wrapped in a catch-all block for the thread.
     # It should catch the AttributeError raised when accessing .id on the dict, log it, and return None.
-    from coreason_identity.models import UserContext
-    from coreason_identity.types import SecretStr
-
-    ctx = UserContext(user_id=SecretStr("sys"), roles=["system"], metadata={})
-    reflex = engine.decide(event, ctx)
+    reflex = engine.decide(event, user_context)
     assert reflex is None
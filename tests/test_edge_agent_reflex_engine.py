@@ -1,4 +1,3 @@
-import datetime
 import time
 from unittest.mock import MagicMock, patch
 
@@ -8,10 +7,9 @@ from coreason_identity.models import UserContext
 from coreason_signal.edge_agent.reflex_engine import ReflexEngine
 from coreason_signal.schemas import AgentReflex, LogEvent, SOPDocument
 
-
-@pytest.fixture
-def mock_vector_store() -> MagicMock:
-    return MagicMock()
+# Validated once; variants are derived with model_copy, which skips
+# re-validation and is noticeably cheaper than constructing from kwargs.
+_ERROR_EVENT = LogEvent(id="evt", level="ERROR", source="test", message="m")
 
 
 def test_reflex_engine_init(mock_vector_store: MagicMock) -> None:
@@ -33,13 +31,7 @@ def test_reflex_engine_init_default() -> None:
 
 def test_decide_ignores_non_error(mock_vector_store: MagicMock, user_context: UserContext) -> None:
     engine = ReflexEngine(vector_store=mock_vector_store)
-    event = LogEvent(
-        id="evt-001",
-        timestamp=datetime.datetime.now().isoformat(),
-        level="INFO",
-        source="test",
-        message="Everything is fine",
-    )
+    event = _ERROR_EVENT.model_copy(update={"id": "evt-001", "level": "INFO", "message": "Everything is fine"})
     reflex = engine.decide(event, user_context)
     assert reflex is None
 
@@ -65,7 +57,7 @@ def test_reflex_execution_logic(mock_vector_store: MagicMock) -> None:
 
 def test_decide_missing_context(mock_vector_store: MagicMock) -> None:
     engine = ReflexEngine(vector_store=mock_vector_store)
-    event = LogEvent(id="1", timestamp="", level="ERROR", source="t", message="m")
+    event = _ERROR_EVENT.model_copy(update={"id": "1", "source": "t"})
     with pytest.raises(ValueError, match="UserContext is required"):
         engine.decide(event, None)  # type: ignore[arg-type]
     mock_vector_store.query.assert_not_called()
@@ -75,13 +67,7 @@ def test_decide_no_sop_found(mock_vector_store: MagicMock, user_context: UserCon
     engine = ReflexEngine(vector_store=mock_vector_store)
     mock_vector_store.query.return_value = []
 
-    event = LogEvent(
-        id="evt-error-1",
-        timestamp=datetime.datetime.now().isoformat(),
-        level="ERROR",
-        source="test",
-        message="Unknown error",
-    )
+    event = _ERROR_EVENT.model_copy(update={"id": "evt-error-1", "message": "Unknown error"})
     reflex = engine.decide(event, user_context)
     assert reflex is None
     mock_vector_store.query.assert_called_once_with("Unknown error", k=1)
@@ -100,13 +86,7 @@ def test_decide_sop_found(mock_vector_store: MagicMock, user_context: UserContex
     )
     mock_vector_store.query.return_value = [sop]
 
-    event = LogEvent(
-        id="evt-vac-1",
-        timestamp=datetime.datetime.now().isoformat(),
-        level="ERROR",
-        source="LiquidHandler",
-        message="ERR_VACUUM_LOW",
-    )
+    event = _ERROR_EVENT.model_copy(update={"id": "evt-vac-1", "source": "LiquidHandler", "message": "ERR_VACUUM_LOW"})
 
     reflex = engine.decide(event, user_context)
 
@@ -125,9 +105,7 @@ def test_decide_default_action(mock_vector_store: MagicMock, user_context: UserC
     sop = SOPDocument(id="SOP-Generic", title="Generic Error", content="Call supervisor.", metadata={})
     mock_vector_store.query.return_value = [sop]
 
-    event = LogEvent(
-        id="evt-gen-1", timestamp=datetime.datetime.now().isoformat(), level="ERROR", source="test", message="Error"
-    )
+    event = _ERROR_EVENT.model_copy(update={"id": "evt-gen-1", "message": "Error"})
 
     reflex = engine.decide(event, user_context)
     assert reflex is not None
@@ -140,13 +118,7 @@ def test_decide_vector_store_exception(mock_vector_store: MagicMock, user_contex
     engine = ReflexEngine(vector_store=mock_vector_store)
     mock_vector_store.query.side_effect = RuntimeError("DB Connection Failed")
 
-    event = LogEvent(
-        id="evt-crit-1",
-        timestamp=datetime.datetime.now().isoformat(),
-        level="ERROR",
-        source="test",
-        message="Critical Failure",
-    )
+    event = _ERROR_EVENT.model_copy(update={"id": "evt-crit-1", "message": "Critical Failure"})
 
     # Should not raise exception, but log it and return None
     reflex = engine.decide(event, user_context)
@@ -157,13 +129,7 @@ def test_decide_empty_message(mock_vector_store: MagicMock, user_context: UserCo
     """Test handling of empty log messages."""
     engine = ReflexEngine(vector_store=mock_vector_store)
 
-    event = LogEvent(
-        id="evt-empty",
-        timestamp=datetime.datetime.now().isoformat(),
-        level="ERROR",
-        source="test",
-        message="   ",  # Whitespace only
-    )
+    event = _ERROR_EVENT.model_copy(update={"id": "evt-empty", "message": "   "})  # Whitespace only
 
     reflex = engine.decide(event, user_context)
     assert reflex is None
@@ -183,13 +149,7 @@ def test_decide_multiple_sops_prioritization(mock_vector_store: MagicMock, user_
     # Mock returning sorted by relevance (best first)
     mock_vector_store.query.return_value = [sop1, sop2]
 
-    event = LogEvent(
-        id="evt-ambig",
-        timestamp=datetime.datetime.now().isoformat(),
-        level="ERROR",
-        source="test",
-        message="Ambiguous error",
-    )
+    event = _ERROR_EVENT.model_copy(update={"id": "evt-ambig", "message": "Ambiguous error"})
 
     reflex = engine.decide(event, user_context)
     assert reflex is not None
@@ -203,13 +163,7 @@ def test_decide_watchdog_timeout(mock_vector_store: MagicMock, user_context: Use
     # Mock _decide_logic to sleep longer than the timeout (0.5s > 0.2s)
     # This helps differentiate between 'wait for completion' vs 'overhead'
     with patch.object(engine, "_decide_logic", side_effect=lambda e: time.sleep(0.5)):
-        event = LogEvent(
-            id="evt-timeout",
-            timestamp=datetime.datetime.now().isoformat(),
-            level="ERROR",
-            source="test",
-            message="Slow query",
-        )
+        event = _ERROR_EVENT.model_copy(update={"id": "evt-timeout", "message": "Slow query"})
 
         start_time = time.time()
         reflex = engine.decide(event, user_context)
@@ -231,33 +185,83 @@ def test_decide_watchdog_internal_error(mock_vector_store: MagicMock, user_conte
 
     # Mock _decide_logic to raise an unexpected exception
     with patch.object(engine, "_decide_logic", side_effect=RuntimeError("Thread Crash")):
-        event = LogEvent(
-            id="evt-crash",
-            timestamp=datetime.datetime.now().isoformat(),
-            level="ERROR",
-            source="test",
-            message="Crash me",
-        )
+        event = _ERROR_EVENT.model_copy(update={"id": "evt-crash", "message": "Crash me"})
 
         reflex = engine.decide(event, user_context)
         assert reflex is None
 
 
-def test_decide_executor_failure(mock_vector_store: MagicMock, user_context: UserContext) -> None:
-    """Test that decide handles failures during task submission."""
+async def test_decide_async_sop_found(mock_vector_store: MagicMock, user_context: UserContext) -> None:
+    """Test the async decide path returns the matched SOP's reflex."""
     engine = ReflexEngine(vector_store=mock_vector_store)
 
-    # Mock the executor submit to raise exception
-    engine._executor = MagicMock()
-    engine._executor.submit.side_effect = RuntimeError("Executor full")
+    reflex_action = AgentReflex(action="RETRY", parameters={}, reasoning="SOP matches.")
+    sop = SOPDocument(id="SOP-1", title="T", content="C", associated_reflex=reflex_action)
+    mock_vector_store.query.return_value = [sop]
 
-    event = LogEvent(
-        id="evt-exec-fail",
-        timestamp=datetime.datetime.now().isoformat(),
-        level="ERROR",
-        source="test",
-        message="Fail submission",
-    )
+    event = _ERROR_EVENT.model_copy(update={"id": "evt-async-1", "message": "ERR_VACUUM_LOW"})
 
-    reflex = engine.decide(event, user_context)
-    assert reflex is None
+    reflex = await engine.decide_async(event, user_context)
+    assert reflex is not None
+    assert reflex.action == "RETRY"
+
+
+async def test_decide_async_missing_context(mock_vector_store: MagicMock) -> None:
+    """Test that the async path enforces the identity context."""
+    engine = ReflexEngine(vector_store=mock_vector_store)
+    event = _ERROR_EVENT.model_copy(update={"id": "1", "source": "t"})
+    with pytest.raises(ValueError, match="UserContext is required"):
+        await engine.decide_async(event, None)  # type: ignore[arg-type]
+
+
+async def test_decide_async_watchdog_timeout(mock_vector_store: MagicMock, user_context: UserContext) -> None:
+    """Test that the async Dead Man's Switch returns PAUSE without waiting."""
+    engine = ReflexEngine(vector_store=mock_vector_store)
+
+    with patch.object(engine, "_decide_logic", side_effect=lambda e: time.sleep(0.5)):
+        event = _ERROR_EVENT.model_copy(update={"id": "evt-async-timeout", "message": "Slow query"})
+
+        start_time = time.time()
+        reflex = await engine.decide_async(event, user_context)
+        duration = time.time() - start_time
+
+        assert duration < 0.4
+        assert reflex is not None
+        assert reflex.action == "PAUSE"
+        assert reflex.reasoning == "Watchdog Timeout > 200ms"
+
+
+async def test_decide_async_internal_error(mock_vector_store: MagicMock, user_context: UserContext) -> None:
+    """Test that the async path catches decision logic crashes."""
+    engine = ReflexEngine(vector_store=mock_vector_store)
+
+    with patch.object(engine, "_decide_logic", side_effect=RuntimeError("Thread Crash")):
+        event = _ERROR_EVENT.model_copy(update={"id": "evt-async-crash", "message": "Crash me"})
+
+        reflex = await engine.decide_async(event, user_context)
+        assert reflex is None
+
+
+def test_decide_dispatch_failure(mock_vector_store: MagicMock, user_context: UserContext) -> None:
+    """Test that dispatch failures propagate instead of reading as 'no reflex'."""
+    engine = ReflexEngine(vector_store=mock_vector_store)
+
+    event = _ERROR_EVENT.model_copy(update={"id": "evt-dispatch-fail", "message": "Fail dispatch"})
+
+    with patch.object(engine, "decide_async", side_effect=RuntimeError("Loop crashed")):
+        with pytest.raises(RuntimeError, match="Loop crashed"):
+            engine.decide(event, user_context)
+
+
+def test_decide_reuses_dispatch_loop(mock_vector_store: MagicMock, user_context: UserContext) -> None:
+    """Test that consecutive sync decisions share one persistent loop."""
+    engine = ReflexEngine(vector_store=mock_vector_store)
+    mock_vector_store.query.return_value = []
+
+    event = _ERROR_EVENT.model_copy(update={"id": "evt-loop-1", "message": "Unknown error"})
+    engine.decide(event, user_context)
+    loop = engine._loop
+    assert loop is not None
+
+    engine.decide(event.model_copy(update={"id": "evt-loop-2"}), user_context)
+    assert engine._loop is loop
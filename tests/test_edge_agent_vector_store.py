@@ -7,7 +7,7 @@ import numpy as np
 import pytest
 
 from coreason_signal.edge_agent.vector_store import LocalVectorStore
-from coreason_signal.schemas import SOPDocument
+from coreason_signal.schemas import AgentReflex, SOPDocument
 
 
 @pytest.fixture
@@ -16,7 +16,7 @@ def mock_embedding_model() -> Generator[MagicMock, None, None]:
         mock_instance = MockTextEmbedding.return_value
 
         # Mock embed to return a fake vector
-        def side_effect(documents: List[str]) -> Generator[List[float], None, None]:
+        def side_effect(documents: List[str], **kwargs: object) -> Generator[List[float], None, None]:
             for _ in documents:
                 yield np.random.rand(384).tolist()
 
@@ -120,6 +120,32 @@ def test_persistence(test_db_path: str, mock_embedding_model: MagicMock) -> None
     assert results[0].id == "P1"
 
 
+def test_persistence_with_reflex(test_db_path: str, mock_embedding_model: MagicMock) -> None:
+    """Test that an associated reflex survives a persistence round-trip."""
+    store1 = LocalVectorStore(db_path=test_db_path)
+    reflex = AgentReflex(action="RETRY", parameters={"max_attempts": 3}, reasoning="Transient fault")
+    store1.add_sops(
+        [SOPDocument(id="R1", title="Retry", content="Retry on fault", metadata={}, associated_reflex=reflex)]
+    )
+
+    store2 = LocalVectorStore(db_path=test_db_path)
+    results = store2.query("fault", k=1)
+    assert len(results) == 1
+    assert isinstance(results[0].associated_reflex, AgentReflex)
+    assert results[0].associated_reflex.action == "RETRY"
+    assert results[0].associated_reflex.parameters == {"max_attempts": 3}
+
+
+def test_query_returns_stored_references(test_db_path: str, mock_embedding_model: MagicMock) -> None:
+    """Test that query returns the ingested objects by index, without reconstruction."""
+    store = LocalVectorStore(db_path=test_db_path)
+    sop = SOPDocument(id="1", title="A", content="Apple", metadata={})
+    store.add_sops([sop])
+
+    results = store.query("Apple", k=1)
+    assert results[0] is sop
+
+
 def test_query_limit_exceeds_count(test_db_path: str, mock_embedding_model: MagicMock) -> None:
     """Test querying with k larger than the number of documents."""
     store = LocalVectorStore(db_path=test_db_path)
@@ -131,6 +157,155 @@ def test_query_limit_exceeds_count(test_db_path: str, mock_embedding_model: Magi
     assert results[0].id == "1"
 
 
+def test_query_embedding_cache(test_db_path: str, mock_embedding_model: MagicMock) -> None:
+    """Test that repeated queries reuse the cached embedding instead of re-encoding."""
+    store = LocalVectorStore(db_path=test_db_path)
+    sops = [SOPDocument(id="1", title="A", content="Apple", metadata={})]
+    store.add_sops(sops)
+
+    embed_calls_after_ingest = mock_embedding_model.embed.call_count
+
+    store.query("Vacuum Pressure Low", k=1)
+    assert mock_embedding_model.embed.call_count == embed_calls_after_ingest + 1
+
+    # Same message (modulo case/whitespace) must not trigger another forward pass
+    store.query("  vacuum pressure low ", k=1)
+    assert mock_embedding_model.embed.call_count == embed_calls_after_ingest + 1
+
+    # A different message does
+    store.query("Temperature High", k=1)
+    assert mock_embedding_model.embed.call_count == embed_calls_after_ingest + 2
+
+
+def test_keyword_prefilter_skips_embedding(test_db_path: str, mock_embedding_model: MagicMock) -> None:
+    """Test that a unique keyword match short-circuits the embedding pass."""
+    store = LocalVectorStore(db_path=test_db_path)
+    store.add_sops(
+        [
+            SOPDocument(id="1", title="Vacuum Pressure Low Recovery", content="Vent and retry.", metadata={}),
+            SOPDocument(id="2", title="Thermal Runaway Shutdown", content="Cut power.", metadata={}),
+        ]
+    )
+    embed_calls_after_ingest = mock_embedding_model.embed.call_count
+
+    results = store.query("ERROR: vacuum pressure low on pump 3", k=1)
+    assert len(results) == 1
+    assert results[0].id == "1"
+    # The hit came from the keyword index; no forward pass ran
+    assert mock_embedding_model.embed.call_count == embed_calls_after_ingest
+
+
+def test_keyword_prefilter_ambiguous_falls_back(test_db_path: str, mock_embedding_model: MagicMock) -> None:
+    """Test that a keyword match shared by several SOPs falls back to vector search."""
+    store = LocalVectorStore(db_path=test_db_path)
+    store.add_sops(
+        [
+            SOPDocument(id="1", title="Vacuum Pressure Low Recovery", content="Vent and retry.", metadata={}),
+            SOPDocument(id="2", title="Vacuum Pressure Low Escalation", content="Page the operator.", metadata={}),
+        ]
+    )
+    embed_calls_after_ingest = mock_embedding_model.embed.call_count
+
+    results = store.query("ERROR: vacuum pressure low on pump 3", k=1)
+    assert len(results) == 1
+    assert mock_embedding_model.embed.call_count == embed_calls_after_ingest + 1
+
+
+def test_keyword_prefilter_metadata_keywords(test_db_path: str, mock_embedding_model: MagicMock) -> None:
+    """Test that metadata keywords feed the prefilter index."""
+    store = LocalVectorStore(db_path=test_db_path)
+    store.add_sops(
+        [
+            SOPDocument(
+                id="1",
+                title="Recovery",
+                content="Vent and retry.",
+                metadata={"keywords": ["ERR_0x4F", "vacuum", "pump"]},
+            ),
+        ]
+    )
+    embed_calls_after_ingest = mock_embedding_model.embed.call_count
+
+    results = store.query("err_0x4f raised by vacuum pump", k=1)
+    assert len(results) == 1
+    assert results[0].id == "1"
+    assert mock_embedding_model.embed.call_count == embed_calls_after_ingest
+
+
+def test_quantize_roundtrip() -> None:
+    """Test int8 quantization bounds and dequantization accuracy."""
+    vector = np.random.rand(384).astype(np.float32) - 0.5
+    quantized, scale = LocalVectorStore._quantize(vector)
+
+    assert quantized.dtype == np.int8
+    assert np.abs(quantized).max() <= 127
+    # Dequantized vector must be close to the original (max error is scale/2)
+    np.testing.assert_allclose(quantized.astype(np.float32) * scale, vector, atol=scale / 2 + 1e-7)
+
+
+def test_stored_vectors_are_normalized(test_db_path: str, mock_embedding_model: MagicMock) -> None:
+    """Test that ingested vectors are unit-length after dequantization."""
+    store = LocalVectorStore(db_path=test_db_path)
+    store.add_sops([SOPDocument(id="1", title="A", content="Apple", metadata={})])
+
+    dequantized = store._matrix.astype(np.float32) * store._scales[:, None]
+    norms = np.linalg.norm(dequantized, axis=1)
+    # Unit norm up to int8 quantization error
+    np.testing.assert_allclose(norms, 1.0, atol=0.05)
+
+
+def test_embedding_model_shared_across_stores(test_db_path: str, mock_embedding_model: MagicMock) -> None:
+    """Test that stores with the same model name share one TextEmbedding instance."""
+    store1 = LocalVectorStore(db_path=test_db_path)
+    store2 = LocalVectorStore(db_path=test_db_path)
+    assert store1._embedding_model is store2._embedding_model
+
+
+def test_templatize() -> None:
+    """Test variable-token collapsing for templated log lines."""
+    assert LocalVectorStore._templatize("connection timeout after 30s") == "connection timeout after <N>s"
+    assert LocalVectorStore._templatize("hardware fault 0x4f on axis 2") == "hardware fault <X> on axis <N>"
+
+
+def test_query_embedding_cache_templated(test_db_path: str, mock_embedding_model: MagicMock) -> None:
+    """Test that messages differing only in variable tokens share a cache entry."""
+    store = LocalVectorStore(db_path=test_db_path)
+    store.add_sops([SOPDocument(id="1", title="A", content="Apple", metadata={})])
+    embed_calls_after_ingest = mock_embedding_model.embed.call_count
+
+    store.query("Connection timeout after 30s", k=1)
+    store.query("Connection timeout after 45s", k=1)
+    assert mock_embedding_model.embed.call_count == embed_calls_after_ingest + 1
+
+
+async def test_query_async(test_db_path: str, mock_embedding_model: MagicMock) -> None:
+    """Test the async query facade returns the same results as the sync path."""
+    store = LocalVectorStore(db_path=test_db_path)
+    store.add_sops([SOPDocument(id="1", title="A", content="Apple", metadata={})])
+
+    results = await store.query_async("fruit", k=1)
+    assert len(results) == 1
+    assert results[0].id == "1"
+
+
+def test_cosine_scores_matches_dequantized_matmul() -> None:
+    """Test that the factored scan equals the explicit dequantized matmul."""
+    rng = np.random.default_rng(42)
+    matrix = rng.integers(-127, 128, size=(8, 384), dtype=np.int8)
+    scales = rng.random(8).astype(np.float32)
+    query = rng.random(384).astype(np.float32)
+
+    expected = (matrix.astype(np.float32) * scales[:, None]) @ query
+    np.testing.assert_allclose(LocalVectorStore._cosine_scores(matrix, scales, query), expected, rtol=1e-5)
+
+
+def test_quantize_zero_vector() -> None:
+    """Test that an all-zero vector quantizes without division by zero."""
+    quantized, scale = LocalVectorStore._quantize(np.zeros(384, dtype=np.float32))
+    assert scale == 1.0
+    assert not quantized.any()
+
+
 def test_add_sops_special_characters(test_db_path: str, mock_embedding_model: MagicMock) -> None:
     """Test adding SOPs with special characters."""
     store = LocalVectorStore(db_path=test_db_path)
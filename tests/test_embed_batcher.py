@@ -0,0 +1,91 @@
+import threading
+import time
+from typing import Generator, List
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from coreason_signal.edge_agent.embed_batcher import EmbedBatcher
+
+
+@pytest.fixture
+def mock_model() -> MagicMock:
+    model = MagicMock()
+
+    def side_effect(documents: List[str]) -> Generator[List[float], None, None]:
+        for _ in documents:
+            yield np.random.rand(384).tolist()
+
+    model.embed.side_effect = side_effect
+    return model
+
+
+def test_single_embed(mock_model: MagicMock) -> None:
+    """Test that a single request is embedded and returned."""
+    batcher = EmbedBatcher(mock_model, batch_size=64, linger_s=0.005)
+    vector = batcher.embed("Vacuum Pressure Low")
+    assert len(vector) == 384
+    mock_model.embed.assert_called_once_with(["Vacuum Pressure Low"])
+    batcher.close()
+
+
+def test_concurrent_embeds_coalesce(mock_model: MagicMock) -> None:
+    """Test that concurrent requests are coalesced into a single model call."""
+    started = threading.Barrier(3)
+    results: List[List[float]] = []
+
+    # Long linger so the worker waits for both requests before embedding
+    batcher = EmbedBatcher(mock_model, batch_size=64, linger_s=0.5)
+
+    def submit(text: str) -> None:
+        started.wait()
+        results.append(batcher.embed(text))
+
+    threads = [threading.Thread(target=submit, args=(f"error {i}",)) for i in range(2)]
+    for t in threads:
+        t.start()
+    started.wait()
+    for t in threads:
+        t.join()
+
+    assert len(results) == 2
+    assert mock_model.embed.call_count == 1
+    assert sorted(mock_model.embed.call_args[0][0]) == ["error 0", "error 1"]
+    batcher.close()
+
+
+def test_zero_linger_embeds_immediately(mock_model: MagicMock) -> None:
+    """Test that linger_s=0 embeds each request without waiting."""
+    batcher = EmbedBatcher(mock_model, batch_size=64, linger_s=0.0)
+    batcher.embed("a")
+    batcher.embed("b")
+    assert mock_model.embed.call_count == 2
+    batcher.close()
+
+
+def test_embed_failure_propagates(mock_model: MagicMock) -> None:
+    """Test that a model failure is raised to the caller."""
+    mock_model.embed.side_effect = RuntimeError("ORT session crashed")
+    batcher = EmbedBatcher(mock_model, batch_size=64, linger_s=0.005)
+
+    with pytest.raises(RuntimeError, match="ORT session crashed"):
+        batcher.embed("boom")
+    batcher.close()
+
+
+def test_close_during_linger_flushes_batch(mock_model: MagicMock) -> None:
+    """Test that close() flushes the in-flight batch before stopping the worker."""
+    batcher = EmbedBatcher(mock_model, batch_size=64, linger_s=0.5)
+    result: List[List[float]] = []
+
+    t = threading.Thread(target=lambda: result.append(batcher.embed("pending")))
+    t.start()
+    # Give the worker time to pull the request and start lingering
+    time.sleep(0.05)
+    batcher.close()
+    t.join()
+
+    assert len(result) == 1
+    assert len(result[0]) == 384
+    assert not batcher._worker.is_alive()
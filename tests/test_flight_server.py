@@ -11,13 +11,13 @@
 import threading
 import time
 from typing import Generator
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pyarrow as pa
 import pyarrow.flight as flight
 import pytest
 
-from coreason_signal.streaming.flight_server import SignalFlightServer
+from coreason_signal.streaming.flight_server import _FLUSH_BATCHES, SignalFlightServer, _default_memory_pool
 
 
 @pytest.fixture
@@ -168,6 +168,131 @@ def test_do_put_stop_iteration(flight_server: SignalFlightServer) -> None:
     assert len(flight_server.get_latest_data()) == 1
 
 
+def test_do_put_flushes_in_groups(flight_server: SignalFlightServer) -> None:
+    """Test that do_put splices accumulated chunks at the flush threshold."""
+    mock_reader = MagicMock()
+    mock_chunk = MagicMock()
+    mock_chunk.__bool__.return_value = True
+
+    chunks = [(mock_chunk, None)] * (_FLUSH_BATCHES + 1)
+    mock_reader.read_chunk.side_effect = [*chunks, StopIteration()]
+
+    flight_server.do_put(MagicMock(), flight.FlightDescriptor.for_path("stream"), mock_reader, MagicMock())
+
+    # One full flush at the threshold plus the tail flush
+    assert len(flight_server.get_latest_data()) == _FLUSH_BATCHES + 1
+
+
+def test_do_put_flushes_on_time_window(flight_server: SignalFlightServer) -> None:
+    """Test that a slow stream flushes by elapsed time, not just batch count."""
+    mock_reader = MagicMock()
+    mock_chunk = MagicMock()
+    mock_chunk.__bool__.return_value = True
+    mock_reader.read_chunk.side_effect = [(mock_chunk, None), (mock_chunk, None), StopIteration()]
+
+    with (
+        patch("coreason_signal.streaming.flight_server._FLUSH_INTERVAL_S", 0.0),
+        patch.object(flight_server, "_extend_buffer", wraps=flight_server._extend_buffer) as mock_extend,
+    ):
+        flight_server.do_put(MagicMock(), flight.FlightDescriptor.for_path("stream"), mock_reader, MagicMock())
+
+    # With the window forced to zero every chunk flushes as it arrives,
+    # well below the 32-batch size threshold; nothing waits for the tail.
+    assert mock_extend.call_count == 2
+    assert len(flight_server.get_latest_data()) == 2
+
+
+def test_stream_id_decode_cache(flight_server: SignalFlightServer) -> None:
+    """Test that descriptor path decodes are cached and bounded."""
+    descriptor = flight.FlightDescriptor.for_path("sensor-1")
+    assert flight_server._stream_id(descriptor) == "sensor-1"
+    # Repeat lookup returns the identical cached str object
+    assert flight_server._stream_id(descriptor) is flight_server._path_cache[b"sensor-1"]
+
+    # Pathless descriptors bypass the cache
+    assert flight_server._stream_id(flight.FlightDescriptor.for_command(b"cmd")) == "unknown"
+
+    # Cache evicts oldest entries once full
+    with patch("coreason_signal.streaming.flight_server._PATH_CACHE_SIZE", 2):
+        flight_server._stream_id(flight.FlightDescriptor.for_path("sensor-2"))
+        flight_server._stream_id(flight.FlightDescriptor.for_path("sensor-3"))
+        assert b"sensor-1" not in flight_server._path_cache
+        assert b"sensor-3" in flight_server._path_cache
+
+
+def test_buffer_overflow_counter() -> None:
+    """Test that evictions from the bounded buffer are counted."""
+    server = SignalFlightServer(port=0, buffer_size=3)
+    try:
+        batch = pa.RecordBatch.from_arrays([pa.array([1.0])], names=["col1"])
+
+        server._extend_buffer([batch, batch])
+        assert server.dropped_count == 0
+
+        # Two more batches push the total to 4; the oldest is evicted
+        server._extend_buffer([batch, batch])
+        assert server.dropped_count == 1
+        assert len(server.get_latest_data()) == 3
+
+        # A batch list larger than the buffer drops the excess too
+        server._extend_buffer([batch] * 5)
+        assert server.dropped_count == 1 + 5
+    finally:
+        server.shutdown()
+
+
+def test_get_latest_data_snapshot_reuse(flight_server: SignalFlightServer) -> None:
+    """Test that repeat snapshots are reused until the buffer changes."""
+    batch = pa.RecordBatch.from_arrays([pa.array([1.0])], names=["col1"])
+    flight_server._extend_buffer([batch])
+
+    first = flight_server.get_latest_data()
+    # No writes in between: the identical cached list is returned
+    assert flight_server.get_latest_data() is first
+
+    flight_server._extend_buffer([batch])
+    second = flight_server.get_latest_data()
+    assert second is not first
+    assert len(second) == 2
+
+
+def test_do_exchange_batch_ingest(flight_server: SignalFlightServer) -> None:
+    """Test that do_exchange enqueues a whole multi-batch stream at once."""
+    batch = pa.RecordBatch.from_arrays([pa.array([1, 2])], names=["a"])
+    table = pa.Table.from_batches([batch, batch])
+
+    mock_reader = MagicMock()
+    mock_reader.read_all.return_value = table
+
+    descriptor = flight.FlightDescriptor.for_path("stream")
+    flight_server.do_exchange(MagicMock(), descriptor, mock_reader, MagicMock())
+
+    latest = flight_server.get_latest_data()
+    assert len(latest) == 2
+    assert latest[0].equals(batch)
+
+
+def test_shutdown_releases_pool_memory() -> None:
+    """Test that shutdown releases unused memory back through the pool."""
+    mock_pool = MagicMock()
+    server = SignalFlightServer(port=0, memory_pool=mock_pool)
+    server_thread = threading.Thread(target=server.serve, daemon=True)
+    server_thread.start()
+    time.sleep(0.5)
+
+    server.shutdown()
+    server_thread.join(timeout=2.0)
+
+    mock_pool.release_unused.assert_called_once()
+
+
+def test_default_memory_pool_fallback() -> None:
+    """Test the system-pool fallback when jemalloc is not compiled in."""
+    with patch("coreason_signal.streaming.flight_server.pa.jemalloc_memory_pool", side_effect=NotImplementedError):
+        pool = _default_memory_pool()
+    assert pool.backend_name == pa.system_memory_pool().backend_name
+
+
 # --- Direct Method Invocation Tests for Coverage ---
 
 
@@ -181,12 +306,7 @@ def test_do_get_direct(flight_server: SignalFlightServer) -> None:
     ticket = flight.Ticket(b"ticket")
 
     stream = flight_server.do_get(context, ticket)
-    assert stream is not None
-
-    # Verify generator logic directly
-    snapshot = [batch]
-    gen = flight_server._stream_generator(snapshot)
-    assert list(gen) == snapshot
+    assert isinstance(stream, flight.RecordBatchStream)
 
 
 def test_do_get_direct_unavailable(flight_server: SignalFlightServer) -> None:
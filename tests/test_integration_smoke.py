@@ -1,4 +1,3 @@
-import datetime
 from pathlib import Path
 from typing import Generator
 from unittest.mock import MagicMock, patch
@@ -17,7 +16,7 @@ def mock_embedding_model() -> Generator[MagicMock, None, None]:
     with patch("coreason_signal.edge_agent.vector_store.TextEmbedding") as mock:
         instance = mock.return_value
         # Mock embed to return a dummy vector (list of generators)
-        instance.embed.side_effect = lambda docs: (np.random.rand(384).tolist() for _ in docs)
+        instance.embed.side_effect = lambda docs, **kwargs: (np.random.rand(384).tolist() for _ in docs)
         yield instance
 
 
@@ -95,7 +94,6 @@ def test_reactor_overheat_recovery_loop(
     # Simulate the application logic: If temp > 100, generate an Error Log
     log_event = LogEvent(
         id="EVT-CRIT-001",
-        timestamp=datetime.datetime.now().isoformat(),
         level="ERROR",
         source="v-sensor-reactor-temp",
         message=f"CRITICAL: Reactor Temperature {detected_temp}C exceeds limit. Initiate protocol.",
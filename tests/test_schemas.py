@@ -1,5 +1,3 @@
-import datetime
-
 import pytest
 from pydantic import ValidationError
 
@@ -17,8 +15,8 @@ def test_device_definition_valid() -> None:
         allowed_reflexes=["RETRY", "ABORT"],
     )
     assert device.id == "LiquidHandler-01"
-    assert str(device.endpoint) == "https://192.168.1.50:50052/"
-    assert device.allowed_reflexes == ["RETRY", "ABORT"]
+    assert device.endpoint == "https://192.168.1.50:50052"
+    assert device.allowed_reflexes == {"RETRY", "ABORT"}
 
 
 def test_device_definition_invalid_url() -> None:
@@ -67,19 +65,31 @@ def test_log_event_valid() -> None:
     """Test creating a valid LogEvent."""
     event = LogEvent(
         id="evt-001",
-        timestamp=datetime.datetime.now().isoformat(),
+        timestamp_ns=1_700_000_000_000_000_000,
         level="ERROR",
         source="LiquidHandler-01",
         message="ERR_VACUUM_PRESSURE_LOW",
         raw_code="0x4F",
     )
     assert event.id == "evt-001"
+    assert event.timestamp_ns == 1_700_000_000_000_000_000
     assert event.level == "ERROR"
     assert event.source == "LiquidHandler-01"
     assert event.message == "ERR_VACUUM_PRESSURE_LOW"
     assert event.raw_code == "0x4F"
 
 
+def test_enum_like_strings_are_interned() -> None:
+    """Test that low-cardinality string fields share a single interned object."""
+    first = LogEvent(id="evt-1", level="".join(["ERR", "OR"]), source="Pump-01", message="m")
+    second = LogEvent(id="evt-2", level="".join(["ER", "ROR"]), source="Pump-01", message="m")
+    assert first.level is second.level
+    assert first.source is second.source
+
+    reflex = AgentReflex(action="".join(["RET", "RY"]), reasoning="r")
+    assert reflex.action is AgentReflex(action="RETRY", reasoning="r").action
+
+
 def test_agent_reflex_valid() -> None:
     """Test creating a valid AgentReflex."""
     reflex = AgentReflex(
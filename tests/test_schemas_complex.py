@@ -96,7 +96,6 @@ def test_schema_forbid_extra_fields() -> None:
     with pytest.raises(ValidationError) as exc:
         LogEvent(
             id="evt-1",
-            timestamp="2025-01-01T00:00:00Z",
             level="INFO",
             source="src",
             message="msg",
@@ -128,9 +127,8 @@ def test_device_definition_ipv6_endpoint() -> None:
         allowed_reflexes=[],
     )
 
-    # Pydantic 2.x HttpUrl stringifies cleanly
-    assert str(device.endpoint).rstrip("/") == ipv6_url
-    assert device.endpoint.port == 8080
+    # The regex validator keeps the endpoint as the raw string
+    assert device.endpoint == ipv6_url
 
 
 def test_log_event_large_payload() -> None:
@@ -143,7 +141,6 @@ def test_log_event_large_payload() -> None:
 
     event = LogEvent(
         id="evt-large",
-        timestamp="now",
         level="DEBUG",
         source="stress_test",
         message=large_message,
@@ -45,6 +45,17 @@ def test_feature_registry_create_feature() -> None:
         pass
 
 
+def test_feature_registry_create_feature_cached() -> None:
+    """Repeated capability names reuse the parsed Feature object."""
+    try:
+        first = FeatureRegistry.create_feature("CachedFeature")
+        second = FeatureRegistry.create_feature("CachedFeature")
+        assert first is second
+    except Exception:
+        # Same caveat as above if sila2 validation fails in the test env.
+        pass
+
+
 def test_feature_registry_create_implementation() -> None:
     mock_server = MagicMock()
     impl = FeatureRegistry.create_implementation(mock_server, "TestFeature")
@@ -12,7 +12,6 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from coreason_identity.models import UserContext
-from pydantic import HttpUrl
 
 from coreason_signal.schemas import DeviceDefinition
 from coreason_signal.sila.server import SiLAGateway
@@ -23,7 +22,7 @@ def mock_device_def() -> DeviceDefinition:
     return DeviceDefinition(
         id="TestInstrument",
         driver_type="SiLA2",
-        endpoint=HttpUrl("http://127.0.0.1:50052"),
+        endpoint="http://127.0.0.1:50052",
         capabilities=["Transfer", "Mix"],
         edge_agent_model="test_model.onnx",
         allowed_reflexes=["PAUSE"],
@@ -44,21 +44,21 @@ def test_recovery_from_sync_failure(twin_syncer: TwinSyncer, mock_connector: Mag
 
     # 1. First sync works (baseline)
     twin_syncer.sync_state(entity_id, prop, 30.0, ts)
-    assert twin_syncer._last_synced_state[entity_id][prop] == 30.0
+    assert twin_syncer._get_last(entity_id, prop) == 30.0
 
     # 2. Update to 37.0 fails due to network error
     mock_connector.update_node.side_effect = RuntimeError("Network Down")
     synced = twin_syncer.sync_state(entity_id, prop, val, ts)
     assert synced is False
     # CRITICAL: Cache should STILL reflect 30.0, not 37.0
-    assert twin_syncer._last_synced_state[entity_id][prop] == 30.0
+    assert twin_syncer._get_last(entity_id, prop) == 30.0
 
     # 3. Retry 37.0 (Network Back Up)
     mock_connector.update_node.side_effect = None
     synced = twin_syncer.sync_state(entity_id, prop, val, ts)
     assert synced is True
     # Now cache should be 37.0
-    assert twin_syncer._last_synced_state[entity_id][prop] == 37.0
+    assert twin_syncer._get_last(entity_id, prop) == 37.0
 
 
 def test_nan_handling(twin_syncer: TwinSyncer, mock_connector: MagicMock) -> None:
@@ -117,8 +117,7 @@ def test_concurrency_smoke(twin_syncer: TwinSyncer, mock_connector: MagicMock) -
             future.result()  # Should not raise
 
     # Verify final state exists
-    assert "Bio-1" in twin_syncer._last_synced_state
-    assert "concurrent_prop" in twin_syncer._last_synced_state["Bio-1"]
+    assert twin_syncer._get_last("Bio-1", "concurrent_prop") is not None
 
 
 def test_transition_from_nan_to_valid(twin_syncer: TwinSyncer) -> None:
@@ -134,7 +133,7 @@ def test_transition_from_nan_to_valid(twin_syncer: TwinSyncer) -> None:
     # Sync valid - should pass (NaN -> Number is significant)
     synced = twin_syncer.sync_state(entity_id, prop, 7.0, "ts")
     assert synced is True
-    assert twin_syncer._last_synced_state[entity_id][prop] == 7.0
+    assert twin_syncer._get_last(entity_id, prop) == 7.0
 
 
 def test_is_significant_change_coverage() -> None: